@@ -10,24 +10,48 @@ from revolve2.experimentation.evolution.abstract_elements import Evaluator as Ev
 class Evaluator(Eval):
     """Here we make an evaluator object, based on the abstract evaluator defined in Revolve2."""
 
-    @staticmethod
-    def evaluate_network(
-        params: npt.NDArray[np.float_], inputs: npt.NDArray[np.float_]
-    ) -> np.float_:
+    # Define all possible inputs for xor and the expected outputs
+    _INPUTS = np.array([[0, 0], [1, 0], [0, 1], [1, 1]], dtype=np.float64)
+    _EXPECTED_OUTPUTS = np.array([0, 1, 1, 0], dtype=np.float64)
+
+    @classmethod
+    def evaluate_population(
+        cls, params: npt.NDArray[np.float_]
+    ) -> npt.NDArray[np.float_]:
         """
-        Pass two inputs through a fully connected relu network.
+        Pass all xor inputs through a fully connected relu network, for every network in the population at once.
+
+        Each row of parameters describes one network:
+        the first layer has two neurons with weights `[0:2]`, bias `[2]` and weights `[3:5]`, bias `[5]`,
+        and the output neuron has weights `[6:8]` and bias `[8]`.
 
-        :param params: The parameters to evaluate.
-        :param inputs: Inputs for network. 2x1 floats.
-        :returns: The output of the network.
+        :param params: The parameters of the networks. Nx9 floats.
+        :returns: Negative sum of squared errors of each network. Nx1 floats.
         """
-        # First layer
-        n0 = np.maximum(0, np.dot(params[:2], inputs) + params[2])
-        n1 = np.maximum(0, np.dot(params[3:5], inputs) + params[5])
+        # Both layers are computed as batched matrix products over the population.
+        # First layer. Reshaped to N x neuron x (weight, weight, bias).
+        first_layer = params[:, :6].reshape(-1, 2, 3)
+        hidden = np.maximum(
+            0,
+            np.matmul(cls._INPUTS, first_layer[:, :, :2].transpose(0, 2, 1))
+            + first_layer[:, None, :, 2],
+        )
+
+        # Second layer.
+        outputs = np.maximum(
+            0,
+            np.matmul(hidden, params[:, 6:8, None])[:, :, 0] + params[:, 8, None],
+        )
 
-        # Second layer
-        output: np.float_ = np.maximum(0, n0 * params[6] + n1 * params[7] + params[8])
-        return output
+        # Calculate the difference between the network outputs and the expect outputs
+        errors = outputs - cls._EXPECTED_OUTPUTS
+
+        """
+        Now we return the sum of squared errors.
+        In our case 0 would be an optimal result.
+        We invert so we can maximize the fitness instead of minimize.
+        """
+        return -np.sum(errors**2, axis=1)  # type: ignore[no-any-return]
 
     def evaluate(self, population: list[Genotype]) -> list[float]:
         """
@@ -36,25 +60,6 @@ class Evaluator(Eval):
         :param population: The population of parameters to measure.
         :returns: Negative sum of squared errors and each individual error. 5x1 floats.
         """
-        results = []
-        for genotype in population:
-            # Define all possible inputs for xor and the expected outputs
-            inputs = np.array([[0, 0], [1, 0], [0, 1], [1, 1]])
-            expected_outputs = np.array([0, 1, 1, 0])
-
-            # Evaluate the provided network parameters
-            outputs = np.array(
-                [self.evaluate_network(genotype.parameters, input) for input in inputs]
-            )
-
-            # Calculate the difference between the network outputs and the expect outputs
-            errors = outputs - expected_outputs
-
-            """
-            Now we add the sum of squared errors to the results.
-            In our case 0 would be an optimal result.
-            We invert so we can maximize the fitness instead of minimize.
-            Finally we convert from a numpy float_ type to the python float type. This is not really important.
-            """
-            results.append(float(-np.sum(errors**2)))
-        return results
+        # Evaluate the whole population in one go, by stacking all parameters into a single matrix.
+        params = np.stack([genotype.parameters for genotype in population])
+        return self.evaluate_population(params).tolist()  # type: ignore[no-any-return]
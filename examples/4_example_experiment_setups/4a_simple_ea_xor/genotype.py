@@ -26,7 +26,21 @@ class Genotype:
         :param rng: Random number generator.
         :returns: The created genotype.
         """
-        return Genotype(rng.random(size=config.NUM_PARAMETERS) * 2 - 1)
+        return Genotype(cls.random_many(rng, 1)[0])
+
+    @staticmethod
+    def random_many(
+        rng: np.random.Generator,
+        n: int,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Create the parameters of many random genotypes at once.
+
+        :param rng: Random number generator.
+        :param n: The number of genotypes to create.
+        :returns: The created parameters. One row per genotype.
+        """
+        return rng.random(size=(n, config.NUM_PARAMETERS)) * 2 - 1
 
     def mutate(
         self,
@@ -40,10 +54,23 @@ class Genotype:
         :param rng: Random number generator.
         :returns: A mutated copy of the provided genotype.
         """
-        return Genotype(
-            rng.normal(scale=config.MUTATE_STD, size=config.NUM_PARAMETERS)
-            + self.parameters
-        )
+        return Genotype(self.mutate_many(self.parameters, rng))
+
+    @staticmethod
+    def mutate_many(
+        parameters: npt.NDArray[np.float_],
+        rng: np.random.Generator,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Mutate the parameters of many genotypes at once.
+
+        The provided parameters will not be changed; mutated copies will be returned.
+
+        :param parameters: The parameters to mutate. One row per genotype.
+        :param rng: Random number generator.
+        :returns: The mutated parameters. One row per genotype.
+        """
+        return parameters + rng.normal(scale=config.MUTATE_STD, size=parameters.shape)
 
     @classmethod
     def crossover(
@@ -60,5 +87,21 @@ class Genotype:
         :param rng: Random number generator.
         :returns: A newly created genotype.
         """
-        mask = rng.random(config.NUM_PARAMETERS)
-        return Genotype(np.where(mask, parent1.parameters, parent2.parameters))
+        return Genotype(cls.crossover_many(parent1.parameters, parent2.parameters, rng))
+
+    @staticmethod
+    def crossover_many(
+        parents1: npt.NDArray[np.float_],
+        parents2: npt.NDArray[np.float_],
+        rng: np.random.Generator,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Perform uniform crossover between many pairs of parameters at once.
+
+        :param parents1: The parameters of the first parents. One row per pair.
+        :param parents2: The parameters of the second parents. One row per pair.
+        :param rng: Random number generator.
+        :returns: The parameters of the created genotypes. One row per pair.
+        """
+        mask = rng.random(parents1.shape) < 0.5
+        return np.where(mask, parents1, parents2)
@@ -41,19 +41,20 @@ class ParentSelector(Selector):
         :param kwargs: Additional kwargs that are not used in this example.
         :returns: Pairs of indices of selected parents. offspring_size x 2 ints, and the parent population in the KWArgs dict.
         """
-        final_selection = np.asarray(
-            [
-                selection.multiple_unique(
-                    2,
-                    [individual.genotype for individual in population],
-                    [individual.fitness for individual in population],
-                    lambda _, fitnesses: selection.tournament(
-                        self._rng, fitnesses, k=1
-                    ),
-                )
-                for _ in range(self._offspring_size)
+        # We run all tournaments for this generation at once: two for every pair of parents.
+        # Pairs in which the same individual won both tournaments are drawn again, so every pair consists of two distinct parents.
+        fitnesses = np.array([individual.fitness for individual in population])
+        final_selection = selection.batched_tournament(
+            self._rng, fitnesses, k=1, n=2 * self._offspring_size
+        ).reshape(-1, 2)
+        duplicates = np.flatnonzero(final_selection[:, 0] == final_selection[:, 1])
+        while len(duplicates) > 0:
+            final_selection[duplicates] = selection.batched_tournament(
+                self._rng, fitnesses, k=1, n=2 * len(duplicates)
+            ).reshape(-1, 2)
+            duplicates = duplicates[
+                final_selection[duplicates, 0] == final_selection[duplicates, 1]
             ]
-        )
         """We select not the parents directly, but their respective indices for the reproduction step."""
         return final_selection, {"parent_population": population}
 
@@ -100,19 +101,10 @@ class SurvivorSelector(Selector):
             ),
         )
 
-        return [
-            Individual(
-                genotype=population[i].genotype,
-                fitness=population[i].fitness,
-            )
-            for i in original_survivors
-        ] + [
-            Individual(
-                genotype=offspring[i].genotype,
-                fitness=offspring[i].fitness,
-            )
-            for i in offspring_survivors
-        ], {}
+        # Individuals are never changed once created, so the survivors can simply be reused in the new population.
+        survivors = [population[i] for i in original_survivors]
+        survivors.extend(offspring[i] for i in offspring_survivors)
+        return survivors, {}
 
 
 class CrossoverReproducer(Reproducer):
@@ -138,15 +130,18 @@ class CrossoverReproducer(Reproducer):
         )  # We select the population of parents that were passed in KWArgs of the parent selector object.
         if parents is None:
             raise KeyError("No children passed.")
-        offspring = [
-            Genotype.crossover(
-                parents[parent1_i].genotype,
-                parents[parent2_i].genotype,
-                self._rng,
-            ).mutate(self._rng)
-            for parent1_i, parent2_i in population
-        ]
-        return offspring
+        """
+        Instead of creating the children one pair of parents at a time, we stack the parameters of all parents into a single matrix.
+        Selecting the rows of both parents for every pair then lets us perform crossover for all children at once.
+        """
+        parent_parameters = np.stack([parent.genotype.parameters for parent in parents])
+        offspring_parameters = Genotype.crossover_many(
+            np.take(parent_parameters, population[:, 0], axis=0),
+            np.take(parent_parameters, population[:, 1], axis=0),
+            self._rng,
+        )
+        offspring_parameters = Genotype.mutate_many(offspring_parameters, self._rng)
+        return [Genotype(parameters) for parameters in offspring_parameters]
 
 
 def main() -> None:
@@ -158,10 +153,8 @@ def main() -> None:
     # Create an initial population.
     logging.info("Generating initial population.")
     initial_genotypes = [
-        Genotype.random(
-            rng=rng,
-        )
-        for _ in range(config.POPULATION_SIZE)
+        Genotype(parameters)
+        for parameters in Genotype.random_many(rng=rng, n=config.POPULATION_SIZE)
     ]
     # Here we instantiate an evaluator, that allows us to evaluate a population of solutions.
     evaluator = Evaluator()
@@ -7,3 +7,4 @@ OFFSPRING_SIZE = 25
 NUM_GENERATIONS = 200
 NUM_PARAMETERS = 9
 MUTATE_STD = 0.05
+GENERATIONS_PER_COMMIT = 10
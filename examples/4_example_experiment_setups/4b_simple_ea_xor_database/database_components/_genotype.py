@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import numpy.typing as npt
 
 from revolve2.experimentation.database import HasId
 from revolve2.experimentation.optimization.ea import Parameters as GenericParameters
@@ -37,7 +38,23 @@ class Genotype(Base, HasId, GenericParameters):
         :param num_parameters: Number of parameters for genotype.
         :returns: The created genotype.
         """
-        return Genotype(rng.random(size=num_parameters) * 2 - 1)
+        return Genotype(cls.random_many(rng, 1, num_parameters)[0])
+
+    @staticmethod
+    def random_many(
+        rng: np.random.Generator,
+        n: int,
+        num_parameters: int,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Create the parameters of many random genotypes at once.
+
+        :param rng: Random number generator.
+        :param n: The number of genotypes to create.
+        :param num_parameters: Number of parameters for each genotype.
+        :returns: The created parameters. One row per genotype.
+        """
+        return rng.random(size=(n, num_parameters)) * 2 - 1
 
     def mutate(
         self,
@@ -55,9 +72,26 @@ class Genotype(Base, HasId, GenericParameters):
         :param num_parameters: Number of parameters for genotype.
         :returns: A mutated copy of the provided genotype.
         """
-        return Genotype(
-            rng.normal(scale=mutate_std, size=num_parameters) + self.parameters
-        )
+        assert len(self.parameters) == num_parameters
+        return Genotype(self.mutate_many(self.parameters, rng, mutate_std))
+
+    @staticmethod
+    def mutate_many(
+        parameters: npt.NDArray[np.float_],
+        rng: np.random.Generator,
+        mutate_std: float,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Mutate the parameters of many genotypes at once.
+
+        The provided parameters will not be changed; mutated copies will be returned.
+
+        :param parameters: The parameters to mutate. One row per genotype.
+        :param rng: Random number generator.
+        :param mutate_std: The standard deviation of the mutation.
+        :returns: The mutated parameters. One row per genotype.
+        """
+        return parameters + rng.normal(scale=mutate_std, size=parameters.shape)
 
     @classmethod
     def crossover(
@@ -76,5 +110,22 @@ class Genotype(Base, HasId, GenericParameters):
         :param num_parameters: The number of parameters for the genotype.
         :returns: A newly created genotype.
         """
-        mask = rng.random(num_parameters)
-        return Genotype(np.where(mask, parent1.parameters, parent2.parameters))
+        assert len(parent1.parameters) == num_parameters
+        return Genotype(cls.crossover_many(parent1.parameters, parent2.parameters, rng))
+
+    @staticmethod
+    def crossover_many(
+        parents1: npt.NDArray[np.float_],
+        parents2: npt.NDArray[np.float_],
+        rng: np.random.Generator,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Perform uniform crossover between many pairs of parameters at once.
+
+        :param parents1: The parameters of the first parents. One row per pair.
+        :param parents2: The parameters of the second parents. One row per pair.
+        :param rng: Random number generator.
+        :returns: The parameters of the created genotypes. One row per pair.
+        """
+        mask = rng.random(parents1.shape) < 0.5
+        return np.where(mask, parents1, parents2)
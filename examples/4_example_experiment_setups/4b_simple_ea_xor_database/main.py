@@ -50,19 +50,23 @@ class ParentSelector(Selector):
         :param kwargs: Additional kwargs that are not used in this example.
         :returns: Pairs of indices of selected parents. offspring_size x 2 ints, and the parent population in the KWArgs dict.
         """
-        return np.asarray(
-            [
-                selection.multiple_unique(
-                    2,
-                    [individual.genotype for individual in population.individuals],
-                    [individual.fitness for individual in population.individuals],
-                    lambda _, fitnesses: selection.tournament(
-                        self._rng, fitnesses, k=1
-                    ),
-                )
-                for _ in range(self._offspring_size)
+        # We run all tournaments for this generation at once: two for every pair of parents.
+        # Pairs in which the same individual won both tournaments are drawn again, so every pair consists of two distinct parents.
+        fitnesses = np.array(
+            [individual.fitness for individual in population.individuals]
+        )
+        parent_pairs = selection.batched_tournament(
+            self._rng, fitnesses, k=1, n=2 * self._offspring_size
+        ).reshape(-1, 2)
+        duplicates = np.flatnonzero(parent_pairs[:, 0] == parent_pairs[:, 1])
+        while len(duplicates) > 0:
+            parent_pairs[duplicates] = selection.batched_tournament(
+                self._rng, fitnesses, k=1, n=2 * len(duplicates)
+            ).reshape(-1, 2)
+            duplicates = duplicates[
+                parent_pairs[duplicates, 0] == parent_pairs[duplicates, 1]
             ]
-        ), {"parent_population": population}
+        return parent_pairs, {"parent_population": population}
 
 
 class SurvivorSelector(Selector):
@@ -85,14 +89,14 @@ class SurvivorSelector(Selector):
         :returns: The selected population and empty kwargs in this implementation.
         :raises KeyError: If no children got passed.
         """
-        offspring: list[Individual] | None = kwargs.get("children")
+        offspring: Population | None = kwargs.get("children")
         if offspring is None:
             raise KeyError("No children passed.")
         original_survivors, offspring_survivors = population_management.steady_state(
             [i.genotype for i in population.individuals],
             [i.fitness for i in population.individuals],
-            [i.genotype for i in offspring],
-            [i.fitness for i in offspring],
+            [i.genotype for i in offspring.individuals],
+            [i.fitness for i in offspring.individuals],
             lambda n, genotypes, fitnesses: selection.multiple_unique(
                 n,
                 genotypes,
@@ -112,8 +116,8 @@ class SurvivorSelector(Selector):
                 ]
                 + [
                     Individual(
-                        genotype=offspring[i].genotype,
-                        fitness=offspring[i].fitness,
+                        genotype=offspring.individuals[i].genotype,
+                        fitness=offspring.individuals[i].fitness,
                     )
                     for i in offspring_survivors
                 ]
@@ -140,25 +144,27 @@ class CrossoverReproducer(Reproducer):
         :returns: The reproduced population.
         :raises KeyError: If the parents are not passed.
         """
-        parents: list[Individual] | None = kwargs.get(
+        parents: Population | None = kwargs.get(
             "parent_population"
         )  # We select the population of parents that were passed in KWArgs of the parent selector object.
         if parents is None:
             raise KeyError("No children passed.")
-        offspring = [
-            Genotype.crossover(
-                parents[parent1_i].genotype,
-                parents[parent2_i].genotype,
-                self._rng,
-                num_parameters=config.NUM_PARAMETERS,
-            ).mutate(
-                self._rng,
-                mutate_std=config.MUTATE_STD,
-                num_parameters=config.NUM_PARAMETERS,
-            )
-            for parent1_i, parent2_i in population
-        ]
-        return offspring
+        """
+        Instead of creating the children one pair of parents at a time, we stack the parameters of all parents into a single matrix.
+        Selecting the rows of both parents for every pair then lets us perform crossover for all children at once.
+        """
+        parent_parameters = np.stack(
+            [parent.genotype.parameters for parent in parents.individuals]
+        )
+        offspring_parameters = Genotype.crossover_many(
+            np.take(parent_parameters, population[:, 0], axis=0),
+            np.take(parent_parameters, population[:, 1], axis=0),
+            self._rng,
+        )
+        offspring_parameters = Genotype.mutate_many(
+            offspring_parameters, self._rng, mutate_std=config.MUTATE_STD
+        )
+        return [Genotype(parameters) for parameters in offspring_parameters]
 
 
 def run_experiment(dbengine: Engine) -> None:
@@ -191,8 +197,10 @@ def run_experiment(dbengine: Engine) -> None:
     # Create an initial population.
     logging.info("Generating initial population.")
     initial_genotypes = [
-        Genotype.random(rng=rng, num_parameters=config.NUM_PARAMETERS)
-        for _ in range(config.POPULATION_SIZE)
+        Genotype(parameters)
+        for parameters in Genotype.random_many(
+            rng=rng, n=config.POPULATION_SIZE, num_parameters=config.NUM_PARAMETERS
+        )
     ]
     # Here we instantiate an evaluator, that allows us to evaluate a population of solutions.
     evaluator = Evaluator()
@@ -226,45 +234,58 @@ def run_experiment(dbengine: Engine) -> None:
         session.commit()
 
     # Start the actual optimization process.
+    """
+    Instead of opening a new session and committing for every generation, we keep a single session open for the whole process.
+    Generations are added to it as they are created and only committed every few generations,
+    so the database writes are batched and we do not pay the price of a transaction for each generation.
+    """
     logging.info("Start optimization process.")
-    while generation.generation_index < config.NUM_GENERATIONS:
-        logging.info(
-            f"Generation {generation.generation_index + 1} / {config.NUM_GENERATIONS}."
-        )
+    with Session(dbengine, expire_on_commit=False) as session:
+        while generation.generation_index < config.NUM_GENERATIONS:
+            logging.info(
+                f"Generation {generation.generation_index + 1} / {config.NUM_GENERATIONS}."
+            )
 
-        # Create offspring.
-        parent_pairs, parent_kwargs = parent_selector.select(population)
-        offspring_genotypes = reproducer.reproduce(
-            parent_pairs, **parent_kwargs
-        )  # we pass the parent pairs and the kwargs.
+            # Create offspring.
+            parent_pairs, parent_kwargs = parent_selector.select(population)
+            offspring_genotypes = reproducer.reproduce(
+                parent_pairs, **parent_kwargs
+            )  # we pass the parent pairs and the kwargs.
 
-        # Evaluate the offspring.
-        offspring_fitnesses = evaluator.evaluate(offspring_genotypes)
+            # Evaluate the offspring.
+            offspring_fitnesses = evaluator.evaluate(offspring_genotypes)
 
-        # Make an intermediate offspring population.
-        offspring_population = Population(
-            individuals=[
-                Individual(genotype=genotype, fitness=fitness)
-                for genotype, fitness in zip(offspring_genotypes, offspring_fitnesses)
-            ]
-        )
+            # Make an intermediate offspring population.
+            offspring_population = Population(
+                individuals=[
+                    Individual(genotype=genotype, fitness=fitness)
+                    for genotype, fitness in zip(
+                        offspring_genotypes, offspring_fitnesses
+                    )
+                ]
+            )
 
-        # Create the next generation by selecting survivors between original population and offspring.
-        population, _ = survivor_selector.select(
-            population,
-            children=offspring_population,
-        )
+            # Create the next generation by selecting survivors between original population and offspring.
+            population, _ = survivor_selector.select(
+                population,
+                children=offspring_population,
+            )
 
-        # Make it all into a generation and save it to the database.
-        generation = Generation(
-            experiment=experiment,
-            generation_index=generation.generation_index + 1,
-            population=population,
-        )
-        logging.info("Saving generation.")
-        with Session(dbengine, expire_on_commit=False) as session:
+            # Make it all into a generation and add it to the database session.
+            generation = Generation(
+                experiment=experiment,
+                generation_index=generation.generation_index + 1,
+                population=population,
+            )
             session.add(generation)
-            session.commit()
+
+            # Save the pending generations to the database every few generations, and after the last one.
+            if (
+                generation.generation_index % config.GENERATIONS_PER_COMMIT == 0
+                or generation.generation_index == config.NUM_GENERATIONS
+            ):
+                logging.info("Saving generations.")
+                session.commit()
 
 
 def main() -> None:
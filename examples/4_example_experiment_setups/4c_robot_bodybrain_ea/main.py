@@ -45,12 +45,14 @@ class ParentSelector(Selector):
         :param kwargs: Other parameters.
         :return: The parent pairs.
         """
+        genotypes = [individual.genotype for individual in population]
+        fitnesses = [individual.fitness for individual in population]
         return np.array(
             [
                 selection.multiple_unique(
                     selection_size=2,
-                    population=[individual.genotype for individual in population],
-                    fitnesses=[individual.fitness for individual in population],
+                    population=genotypes,
+                    fitnesses=fitnesses,
                     selection_function=lambda _, fitnesses: selection.tournament(
                         rng=self.rng, fitnesses=fitnesses, k=1
                     ),
@@ -106,19 +108,11 @@ class SurvivorSelector(Selector):
             ),
         )
 
-        return [
-            Individual(
-                population[i].genotype,
-                population[i].fitness,
-            )
-            for i in original_survivors
-        ] + [
-            Individual(
-                offspring[i],
-                offspring_fitness[i],
-            )
-            for i in offspring_survivors
-        ], {}
+        survivors = [population[i] for i in original_survivors]
+        survivors.extend(
+            Individual(offspring[i], offspring_fitness[i]) for i in offspring_survivors
+        )
+        return survivors, {}
 
 
 class CrossoverReproducer(Reproducer):
@@ -53,16 +53,14 @@ class ParentSelector(Selector):
         :param kwargs: Other parameters.
         :return: The parent pairs.
         """
+        genotypes = [individual.genotype for individual in population.individuals]
+        fitnesses = [individual.fitness for individual in population.individuals]
         return np.array(
             [
                 selection.multiple_unique(
                     selection_size=2,
-                    population=[
-                        individual.genotype for individual in population.individuals
-                    ],
-                    fitnesses=[
-                        individual.fitness for individual in population.individuals
-                    ],
+                    population=genotypes,
+                    fitnesses=fitnesses,
                     selection_function=lambda _, fitnesses: selection.tournament(
                         rng=self.rng, fitnesses=fitnesses, k=2
                     ),
@@ -1,8 +1,15 @@
 """Functions for selecting individuals from populations in EA algorithms."""
 
+from ._batched_tournament import batched_tournament
 from ._multiple_unique import multiple_unique
 from ._pareto_frontier import pareto_frontier
 from ._topn import topn
 from ._tournament import tournament
 
-__all__ = ["multiple_unique", "pareto_frontier", "topn", "tournament"]
+__all__ = [
+    "batched_tournament",
+    "multiple_unique",
+    "pareto_frontier",
+    "topn",
+    "tournament",
+]
@@ -0,0 +1,28 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def batched_tournament(
+    rng: np.random.Generator,
+    fitnesses: list[float] | npt.NDArray[np.float_],
+    k: int,
+    n: int,
+) -> npt.NDArray[np.int_]:
+    """
+    Perform `n` independent tournament selections at once and return the indices of the winners.
+
+    Equivalent to calling `tournament` `n` times, but draws all participants in a single call.
+
+    :param rng: Random number generator.
+    :param fitnesses: List of finesses of individuals that join the tournaments.
+    :param k: Amount of individuals to participate in each tournament.
+    :param n: Amount of tournaments to perform.
+    :returns: The indices of the individuals that won the tournaments. n ints.
+    """
+    fitnesses_arr = np.asarray(fitnesses)
+    assert len(fitnesses_arr) >= k
+
+    participant_indices = rng.integers(0, len(fitnesses_arr), size=(n, k))
+    return participant_indices[  # type: ignore[no-any-return]
+        np.arange(n), np.argmax(fitnesses_arr[participant_indices], axis=1)
+    ]
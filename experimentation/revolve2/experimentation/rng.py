@@ -24,6 +24,9 @@ def seed_from_string(text: str) -> int:
     """
     Convert a string seed to an integer seed.
 
+    The string is hashed with sha256 rather than the builtin `hash`, which is randomized between Python processes.
+    The resulting (large) integer can be used directly as seed, as numpy turns it into a `SeedSequence`.
+
     :param text: The seed as string.
     :returns: The seed as integer.
     """
@@ -43,6 +46,23 @@ def make_rng(seed: int) -> np.random.Generator:
     return np.random.Generator(np.random.PCG64(seed))
 
 
+def make_rngs(seed: int, num_rngs: int) -> list[np.random.Generator]:
+    """
+    Create multiple independent numpy random number generators from a single seed.
+
+    The generators are spawned from a `numpy.random.SeedSequence`,
+    so their streams do not overlap and can for example be given to parallel workers.
+
+    :param seed: The seed to use.
+    :param num_rngs: The number of random number generators to create.
+    :returns: The random number generators.
+    """
+    return [
+        np.random.Generator(np.random.PCG64(seed_sequence))
+        for seed_sequence in np.random.SeedSequence(seed).spawn(num_rngs)
+    ]
+
+
 def make_rng_time_seed(log_seed: bool = True) -> np.random.Generator:
     """
     Create a numpy random number generator from a seed.
@@ -60,9 +60,7 @@ class BrainCpgNetworkStatic(Brain):
         """
         initial_state = cpg_network_structure.make_uniform_state(initial_state_uniform)
         weight_matrix = (
-            cpg_network_structure.make_connection_weights_matrix_from_params(
-                list(params)
-            )
+            cpg_network_structure.make_connection_weights_matrix_from_params(params)
         )
         return BrainCpgNetworkStatic(
             initial_state=initial_state,
@@ -4,7 +4,7 @@ import numpy as np
 import numpy.typing as npt
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cpg:
     """Identifies a cpg to be used in a cpg network structure."""
 
@@ -14,7 +14,7 @@ class Cpg:
         return self.index < other.index
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, init=False, slots=True)
 class CpgPair:
     """A pair of CPGs that assures that the first cpg always has the lowest index."""
 
@@ -56,6 +56,11 @@ class CpgNetworkStructure:
     cpgs: list[Cpg]
     connections: set[CpgPair]
 
+    _sorted_cpg_indices: npt.NDArray[np.int_]
+    _sorted_connection_indices_lowest: npt.NDArray[np.int_]
+    _sorted_connection_indices_highest: npt.NDArray[np.int_]
+    _uniform_state_mask: npt.NDArray[np.float_]
+
     def __init__(self, cpgs: list[Cpg], connections: set[CpgPair]) -> None:
         """
         Initialize this object.
@@ -63,11 +68,27 @@ class CpgNetworkStructure:
         :param cpgs: The CPGs used in the structure.
         :param connections: The connections between CPGs.
         """
-        assert isinstance(connections, set)
-
         self.cpgs = cpgs
         self.connections = connections
 
+        # The order in which parameters are mapped to cpgs and connections never changes, so sort only once.
+        sorted_connections = sorted(connections)
+        self._sorted_cpg_indices = np.array(
+            [cpg.index for cpg in sorted(cpgs)], dtype=np.int_
+        )
+        self._sorted_connection_indices_lowest = np.array(
+            [pair.cpg_index_lowest.index for pair in sorted_connections],
+            dtype=np.int_,
+        )
+        self._sorted_connection_indices_highest = np.array(
+            [pair.cpg_index_highest.index for pair in sorted_connections],
+            dtype=np.int_,
+        )
+
+        self._uniform_state_mask = np.concatenate(
+            [np.ones(len(cpgs)), -np.ones(len(cpgs))]
+        )
+
     @staticmethod
     def make_cpgs(num_cpgs: int) -> list[Cpg]:
         """
@@ -90,24 +111,79 @@ class CpgNetworkStructure:
         :param external_connection_weights: The external weights.
         :returns: The created matrix.
         """
-        state_size = self.num_cpgs * 2
+        assert internal_connection_weights.keys() == set(self.cpgs)
+        assert external_connection_weights.keys() == self.connections
+
+        return self._make_connection_weights_matrix(
+            np.fromiter(
+                (cpg.index for cpg in internal_connection_weights.keys()),
+                dtype=np.int_,
+                count=len(internal_connection_weights),
+            ),
+            np.fromiter(
+                internal_connection_weights.values(),
+                dtype=np.float_,
+                count=len(internal_connection_weights),
+            ),
+            np.fromiter(
+                (pair.cpg_index_lowest.index for pair in external_connection_weights),
+                dtype=np.int_,
+                count=len(external_connection_weights),
+            ),
+            np.fromiter(
+                (pair.cpg_index_highest.index for pair in external_connection_weights),
+                dtype=np.int_,
+                count=len(external_connection_weights),
+            ),
+            np.fromiter(
+                external_connection_weights.values(),
+                dtype=np.float_,
+                count=len(external_connection_weights),
+            ),
+        )
 
-        assert set(internal_connection_weights.keys()) == set(self.cpgs)
-        assert set(external_connection_weights.keys()) == self.connections
+    def _make_connection_weights_matrix(
+        self,
+        internal_indices: npt.NDArray[np.int_],
+        internal_weights: npt.NDArray[np.float_],
+        external_indices_lowest: npt.NDArray[np.int_],
+        external_indices_highest: npt.NDArray[np.int_],
+        external_weights: npt.NDArray[np.float_],
+        out: npt.NDArray[np.float_] | None = None,
+    ) -> npt.NDArray[np.float_]:
+        """
+        Create a weight matrix from cpg indices and their matching weights.
+
+        :param internal_indices: The index of the cpg of each internal weight.
+        :param internal_weights: The internal weights.
+        :param external_indices_lowest: The lowest cpg index of each external weight.
+        :param external_indices_highest: The highest cpg index of each external weight.
+        :param external_weights: The external weights.
+        :param out: Matrix to write the weights into. If None, a new matrix is created.
+        :returns: The created matrix.
+        """
+        state_size = self.num_cpgs * 2
 
-        weight_matrix = np.zeros((state_size, state_size))
+        if out is None:
+            weight_matrix = np.zeros((state_size, state_size))
+        else:
+            assert out.shape == (state_size, state_size)
+            weight_matrix = out
+            weight_matrix.fill(0)
 
-        for cpg, weight in internal_connection_weights.items():
-            weight_matrix[cpg.index][self.num_cpgs + cpg.index] = weight
-            weight_matrix[self.num_cpgs + cpg.index][cpg.index] = -weight
+        weight_matrix[internal_indices, self.num_cpgs + internal_indices] = (
+            internal_weights
+        )
+        weight_matrix[self.num_cpgs + internal_indices, internal_indices] = (
+            -internal_weights
+        )
 
-        for cpg_pair, weight in external_connection_weights.items():
-            weight_matrix[cpg_pair.cpg_index_lowest.index][
-                cpg_pair.cpg_index_highest.index
-            ] = weight
-            weight_matrix[cpg_pair.cpg_index_highest.index][
-                cpg_pair.cpg_index_lowest.index
-            ] = -weight
+        weight_matrix[external_indices_lowest, external_indices_highest] = (
+            external_weights
+        )
+        weight_matrix[external_indices_highest, external_indices_lowest] = (
+            -external_weights
+        )
 
         return weight_matrix
 
@@ -121,32 +197,31 @@ class CpgNetworkStructure:
         return len(self.cpgs) + len(self.connections)
 
     def make_connection_weights_matrix_from_params(
-        self, params: list[float]
+        self,
+        params: list[float] | npt.NDArray[np.float_],
+        out: npt.NDArray[np.float_] | None = None,
     ) -> npt.NDArray[np.float_]:
         """
         Create a connection weights matrix from a list if connections.
 
+        The first `num_cpgs` parameters are the internal weights, ordered by cpg index.
+        The remaining parameters are the external weights, ordered by cpg pair.
+
         :param params: The connections to create the matrix from.
+        :param out: Matrix to write the weights into, to reuse it instead of allocating a new one. If None, a new matrix is created.
         :returns: The created matrix.
         """
         assert len(params) == self.num_connections
 
-        # a = ",".join(f"{c.index}" for c in self.cpgs)
-        # b = ",".join(f"{pair.cpg_index_lowest.index} -> {pair.cpg_index_highest.index}"
-        #              for pair in self.connections)
-        # print(f"[kgd-debug] make matrix: {a}; {b}")
+        params_array = np.asarray(params, dtype=np.float_)
 
-        internal_connection_weights = {
-            cpg: weight for cpg, weight in zip(sorted(self.cpgs), params[: self.num_cpgs])
-        }
-
-        external_connection_weights = {
-            pair: weight
-            for pair, weight in zip(sorted(self.connections), params[self.num_cpgs :])
-        }
-
-        return self.make_connection_weights_matrix(
-            internal_connection_weights, external_connection_weights
+        return self._make_connection_weights_matrix(
+            self._sorted_cpg_indices,
+            params_array[: self.num_cpgs],
+            self._sorted_connection_indices_lowest,
+            self._sorted_connection_indices_highest,
+            params_array[self.num_cpgs :],
+            out,
         )
 
     @property
@@ -169,10 +244,7 @@ class CpgNetworkStructure:
         :param value: The value to use for all states
         :returns: The array of states.
         """
-        _half = self.num_states // 2
-        mask = np.hstack([np.full(_half, 1), np.full(_half, -1)])
-
-        return mask * value
+        return self._uniform_state_mask * value
 
     @property
     def num_cpgs(self) -> int:
@@ -10,7 +10,7 @@ from ._modular_robot_simulation_handler import ModularRobotSimulationHandler
 from ._terrain import Terrain
 
 
-@dataclass
+@dataclass(slots=True)
 class ModularRobotScene:
     """A scene of modular robots in a terrain."""
 
@@ -29,23 +29,26 @@ class ModularRobotScene:
     _mujoco_specifics: list[Tuple[Optional[str], str, dict[str, Any]]] = field(default_factory=list)
 
     def add_robot(
-        self, robot: ModularRobot, pose: Pose = Pose(), translate_z_aabb: bool = True
+        self,
+        robot: ModularRobot,
+        pose: Pose | None = None,
+        translate_z_aabb: bool = True,
     ) -> None:
         """
         Add a robot to the scene.
 
         :param robot: The robot to add.
-        :param pose: The pose of the robot.
+        :param pose: The pose of the robot. Defaults to the origin. The scene keeps its own copy.
         :param translate_z_aabb: Whether the robot should be translated upwards so it's T-pose axis-aligned bounding box is exactly on the ground. I.e. if the robot should be placed exactly on the ground. The pose parameters is still added afterwards.
         """
+        # A fresh default pose is not shared with anyone, so it needs no copy.
+        if pose is None:
+            pose = Pose()
+        else:
+            pose = Pose(pose.position.copy(), pose.orientation.copy())
+
         # Add the robot to the robots list.
-        self._robots.append(
-            (
-                robot,
-                Pose(pose.position.copy(), pose.orientation.copy()),
-                translate_z_aabb,
-            )
-        )
+        self._robots.append((robot, pose, translate_z_aabb))
 
     def add_interactive_object(self, objt: MultiBodySystem) -> None:
         """
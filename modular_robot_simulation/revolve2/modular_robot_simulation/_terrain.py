@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from revolve2.simulation.scene.geometry import Geometry
 
 
-@dataclass
+@dataclass(slots=True)
 class Terrain:
     """Terrain consisting of only static geometry."""
 
@@ -1,11 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Tuple, Optional, Any
+from typing import Any, Optional, Sequence, Tuple
 
 from ._multi_body_system import MultiBodySystem
 from ._simulation_handler import SimulationHandler
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Scene:
     """Description of a scene that can be simulated."""
 
@@ -31,15 +31,16 @@ class Scene:
         self._multi_body_systems.append(multi_body_system)
 
     @property
-    def multi_body_systems(self) -> list[MultiBodySystem]:
+    def multi_body_systems(self) -> Sequence[MultiBodySystem]:
         """
         Get the multi-body systems in scene.
 
-        Do not make changes to this list.
+        This is a read-only view on the multi-body systems, not a copy.
+        Use `add_multi_body_system` to add to it.
 
         :returns: The multi-body systems in the scene.
         """
-        return self._multi_body_systems[:]
+        return self._multi_body_systems
 
     def add_mujoco_element(self, parent: Optional[str], tag: str, kwargs):
         """
@@ -51,5 +52,13 @@ class Scene:
         self._mujoco_specifics.append((parent, tag, kwargs))
 
     @property
-    def mujoco_specifics(self) -> list[Tuple[Optional[str], str, dict[str, Any]]]:
-        return self._mujoco_specifics[:]
+    def mujoco_specifics(self) -> Sequence[Tuple[Optional[str], str, dict[str, Any]]]:
+        """
+        Get the mujoco-specific elements in the scene.
+
+        This is a read-only view on the elements, not a copy.
+        Use `add_mujoco_element` to add to it.
+
+        :returns: The mujoco-specific elements in the scene.
+        """
+        return self._mujoco_specifics
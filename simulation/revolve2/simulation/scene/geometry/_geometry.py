@@ -4,7 +4,7 @@ from .._pose import Pose
 from .textures import Texture
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Geometry:
     """Geometry describing part of a rigid body shape."""
 
@@ -4,7 +4,7 @@ from .._aabb import AABB
 from ._geometry import Geometry
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GeometryBox(Geometry):
     """Box geometry."""
 
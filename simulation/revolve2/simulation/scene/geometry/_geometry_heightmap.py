@@ -9,7 +9,7 @@ from ._geometry import Geometry
 from .textures import MapType, Texture
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GeometryHeightmap(Geometry):
     """
     A heightmap geometry.
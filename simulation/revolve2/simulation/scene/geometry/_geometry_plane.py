@@ -13,7 +13,7 @@ def _default_texture():
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GeometryPlane(Geometry):
     """A flat plane geometry."""
 
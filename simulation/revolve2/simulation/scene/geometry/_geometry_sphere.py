@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ._geometry import Geometry
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GeometrySphere(Geometry):
     """Box geometry."""
 
@@ -5,13 +5,39 @@ from __future__ import annotations
 import math
 from functools import lru_cache
 from numbers import Number
-from typing import Any, List, Type
+from typing import Any, Callable
 
 import numpy as np
 from pyrr.objects.base import BaseMatrix33, BaseVector, NpProxy
 
 from . import vector2aux as vector2
 
+_NUMBER_TYPES = (Number, np.number)
+_VECTOR_TYPES = (np.ndarray, list)
+
+
+def _check_number_type(t: type) -> bool:
+    return issubclass(t, _NUMBER_TYPES)
+
+
+def _check_vector_type(t: type) -> bool:
+    # Vector2 itself is covered by np.ndarray.
+    return issubclass(t, _VECTOR_TYPES)
+
+
+# The checks are cached per type. lru_cache types its arguments as Hashable, which mypy does not accept types as,
+# so the cached checks are declared with the signature of the checks themselves.
+_is_number_type: Callable[[type], bool] = lru_cache(maxsize=None)(_check_number_type)
+_is_vector_type: Callable[[type], bool] = lru_cache(maxsize=None)(_check_vector_type)
+
+
+def _as_vector2(result: Any) -> Vector2:
+    # Arithmetic on a Vector2 already yields a Vector2.
+    # It only needs rebuilding (which checks the shape) if broadcasting changed its shape.
+    if type(result) is Vector2 and result.shape == (2,):
+        return result
+    return Vector2(result)
+
 
 class Vector2(BaseVector):  # type:ignore
     """Represents a 2-dimensional Vector. The Vector2 class is based on the pyrr implementation of vectors."""
@@ -54,28 +80,7 @@ class Vector2(BaseVector):  # type:ignore
 
     ########################
     # Operators
-    @staticmethod
-    def __has_type(other: Any, types: List[Type]) -> bool:
-        return any(issubclass(other, t) for t in types)
-
-    @classmethod
-    def __is_number(cls, other):
-        return cls.__is_number_type(type(other))
-
-    @classmethod
-    @lru_cache
-    def __is_number_type(cls, t: Type):
-        return cls.__has_type(t, [Number, np.number])
-
-    @classmethod
-    def __is_vector(cls, other):
-        return cls.__is_vector_type(type(other))
-
-    @classmethod
-    @lru_cache
-    def __is_vector_type(cls, t: Type):
-        return cls.__has_type(t, [cls, np.ndarray, list])
-
+    # The common operand types are checked by identity first, skipping the cached predicates.
     def __add__(self, other: Any) -> Vector2:  # type:ignore
         """
         Add to the existing Vector2.
@@ -83,10 +88,15 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: The added Vector2.
         """
-        if self.__is_number(other):
-            return Vector2(super(Vector2, self).__add__(other))
-        elif self.__is_vector(other):
-            return Vector2(super(Vector2, self).__add__(other))
+        t = type(other)
+        if (
+            t is Vector2
+            or t is float
+            or t is int
+            or _is_number_type(t)
+            or _is_vector_type(t)
+        ):
+            return _as_vector2(super(Vector2, self).__add__(other))
         else:
             self._unsupported_type("add", other)
 
@@ -97,10 +107,15 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: The subtracted Vector2.
         """
-        if self.__is_number(other):
-            return Vector2(super(Vector2, self).__sub__(other))
-        elif self.__is_vector(other):
-            return Vector2(super(Vector2, self).__sub__(other))
+        t = type(other)
+        if (
+            t is Vector2
+            or t is float
+            or t is int
+            or _is_number_type(t)
+            or _is_vector_type(t)
+        ):
+            return _as_vector2(super(Vector2, self).__sub__(other))
         else:
             self._unsupported_type("subtract", other)
 
@@ -111,8 +126,9 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: the multiplied Vector2.
         """
-        if self.__is_number(other):
-            return Vector2(super(Vector2, self).__mul__(other))
+        t = type(other)
+        if t is float or t is int or _is_number_type(t):
+            return _as_vector2(super(Vector2, self).__mul__(other))
         else:
             self._unsupported_type("multiply", other)
 
@@ -123,7 +139,7 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: The cross-product.
         """
-        if self.__is_vector(other):
+        if _is_vector_type(type(other)):
             return self.cross(other)
         else:
             self._unsupported_type("XOR", other)
@@ -135,7 +151,7 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: The dot-product.
         """
-        if self.__is_vector(other):
+        if _is_vector_type(type(other)):
             return self.dot(other)
         else:
             self._unsupported_type("OR", other)
@@ -147,7 +163,7 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: whether they are unequal.
         """
-        if self.__is_vector(other):
+        if _is_vector_type(type(other)):
             return bool(np.any(super(Vector2, self).__ne__(other)))
         else:
             self._unsupported_type("NE", other)
@@ -159,7 +175,7 @@ class Vector2(BaseVector):  # type:ignore
         :param other: The other Vector2.
         :return: whether they are equal.
         """
-        if self.__is_vector(other):
+        if _is_vector_type(type(other)):
             return bool(np.all(super(Vector2, self).__eq__(other)))
         else:
             self._unsupported_type("EQ", other)
@@ -169,12 +185,36 @@ class Vector2(BaseVector):  # type:ignore
     @property
     def inverse(self) -> Vector2:
         """:return: the inverted Vector2."""
-        return Vector2(-self)
+        return _as_vector2(-self)
+
+    def dot(self, other: Any) -> float:
+        """
+        Calculate the dot-product.
+
+        Computed on python scalars, as numpy dispatch dominates the cost for two elements.
+
+        :param other: The other Vector2.
+        :return: The dot-product.
+        """
+        x, y = self.tolist()
+        return float(x * other[0] + y * other[1])
+
+    def cross(self, other: Any) -> float:
+        """
+        Calculate the cross-product.
+
+        For 2d vectors this is the z-component of the 3d cross-product.
+
+        :param other: The other Vector2.
+        :return: The cross-product.
+        """
+        x, y = self.tolist()
+        return float(x * other[1] - y * other[0])
 
     @property
     def length(self) -> float:
-        return math.sqrt(self.x**2 + self.y**2)
+        return math.hypot(*self.tolist())
 
     @property
     def normalized(self) -> Vector2:
-        return Vector2(self / self.length)
+        return _as_vector2(self / self.length)
@@ -0,0 +1,81 @@
+import queue
+import threading
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+
+class AsyncVideoWriter:
+    """
+    Encodes video frames on a background thread.
+
+    OpenCV releases the GIL while encoding, so writing frames overlaps with the simulation.
+    Frames are written into a small set of reused buffers, bounding both memory and how far the encoder can lag behind.
+    """
+
+    _video: cv2.VideoWriter
+    _free_frames: queue.Queue[npt.NDArray[np.uint8]]
+    _pending_frames: queue.Queue[npt.NDArray[np.uint8] | None]
+    _thread: threading.Thread
+    _error: BaseException | None
+
+    def __init__(
+        self,
+        video: cv2.VideoWriter,
+        frame_shape: tuple[int, int, int],
+        max_pending: int = 4,
+    ) -> None:
+        """
+        Initialize this object and start the encoding thread.
+
+        :param video: The video writer to encode the frames with. It is released by `release`.
+        :param frame_shape: The shape of a frame, (height, width, channels).
+        :param max_pending: The maximum number of frames waiting to be encoded.
+        """
+        self._video = video
+        self._free_frames = queue.Queue()
+        for _ in range(max_pending + 1):
+            self._free_frames.put(np.empty(frame_shape, dtype=np.uint8))
+        self._pending_frames = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._encode, daemon=True)
+        self._thread.start()
+
+    def next_frame(self) -> npt.NDArray[np.uint8]:
+        """
+        Get a buffer to draw the next frame into, blocking while the encoder is behind.
+
+        :returns: The buffer. Hand it back using `write`.
+        """
+        return self._free_frames.get()
+
+    def write(self, frame: npt.NDArray[np.uint8]) -> None:
+        """
+        Queue a frame obtained from `next_frame` for encoding.
+
+        :param frame: The frame, in BGR format.
+        """
+        self._pending_frames.put(frame)
+
+    def release(self) -> None:
+        """
+        Encode all remaining frames and release the video writer.
+
+        :raises RuntimeError: If encoding a frame failed.
+        """
+        self._pending_frames.put(None)
+        self._thread.join()
+        self._video.release()
+        if self._error is not None:
+            raise RuntimeError("Encoding a video frame failed.") from self._error
+
+    def _encode(self) -> None:
+        while (frame := self._pending_frames.get()) is not None:
+            if self._error is None:
+                try:
+                    self._video.write(frame)
+                except BaseException as e:
+                    # Keep recycling buffers so the simulation does not block; the error is raised on release.
+                    self._error = e
+            self._free_frames.put(frame)
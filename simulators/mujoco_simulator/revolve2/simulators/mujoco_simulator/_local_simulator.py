@@ -1,6 +1,7 @@
 import concurrent.futures
 import logging
 import os
+from concurrent.futures.process import BrokenProcessPool
 
 from revolve2.simulation.scene import SimulationState
 from revolve2.simulation.simulator import Batch, Simulator
@@ -20,6 +21,7 @@ class LocalSimulator(Simulator):
     _fast_sim: bool
     _manual_control: bool
     _viewer_type: ViewerType
+    _executor: concurrent.futures.ProcessPoolExecutor | None
 
     def __init__(
         self,
@@ -63,6 +65,49 @@ class LocalSimulator(Simulator):
             if isinstance(viewer_type, str)
             else viewer_type
         )
+        self._executor = None
+
+    def __del__(self) -> None:
+        """
+        Shut down the worker processes, if any were started, without waiting for them.
+
+        This can run during interpreter teardown, where blocking on the workers is unsafe.
+        Call `close` to shut the workers down cleanly.
+        """
+        self._shutdown_executor(wait=False)
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes used for parallel simulation, waiting for them to exit.
+
+        The simulator remains usable; a new pool is started by the next batch that needs one.
+        """
+        self._shutdown_executor(wait=True)
+
+    def _shutdown_executor(self, wait: bool) -> None:
+        """
+        Shut down the worker pool, if it was started.
+
+        :param wait: Whether to wait for the workers to exit. If not, pending simulations are cancelled.
+        """
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """
+        Get the worker pool, starting it on first use.
+
+        The pool is kept alive across batches so its startup cost is only paid once.
+
+        :returns: The worker pool.
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._num_simulators
+            )
+        return self._executor
 
     def simulate_batch(self, batch: Batch) -> list[list[SimulationState]]:
         """
@@ -95,9 +140,8 @@ class LocalSimulator(Simulator):
             return [[]]
 
         if self._num_simulators > 1:
-            with concurrent.futures.ProcessPoolExecutor(
-                max_workers=self._num_simulators
-            ) as executor:
+            executor = self._get_executor()
+            try:
                 futures = [
                     executor.submit(
                         simulate_scene,  # This is the function to call, followed by the parameters of the function
@@ -118,6 +162,11 @@ class LocalSimulator(Simulator):
                     for scene_index, scene in enumerate(batch.scenes)
                 ]
                 results = [future.result() for future in futures]
+            except BrokenProcessPool:
+                # A worker died (e.g. MuJoCo crashed), which leaves the pool unusable.
+                # Drop it, so the next batch starts a fresh one.
+                self.close()
+                raise
         else:
             results = [
                 simulate_scene(
@@ -86,6 +86,9 @@ def simulate_manual_scene(
             mujoco.mj_step(model, data)
 
             position = viewer.render()
+            # Check if simulation was closed
+            if position == -1:
+                break
             if position is not None and prev_position != position:
                 prev_position = position
                 target = positions[prev_position]
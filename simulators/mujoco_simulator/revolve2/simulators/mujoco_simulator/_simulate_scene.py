@@ -11,6 +11,7 @@ from revolve2.simulation.scene import Scene, SimulationState
 from revolve2.simulation.simulator import RecordSettings
 from revolve2.simulation.simulator._simulator import Callback
 from ._abstraction_to_mujoco_mapping import CameraSensorMujoco
+from ._async_video_writer import AsyncVideoWriter
 from ._control_interface_impl import ControlInterfaceImpl
 from ._open_gl_vision import OpenGLVision
 from ._render_backend import RenderBackend
@@ -18,6 +19,16 @@ from ._scene_to_model import scene_to_model
 from ._simulation_state_impl import SimulationStateImpl
 from .viewers import CustomMujocoViewer, NativeMujocoViewer, ViewerType
 
+_STEP_TOLERANCE = 1e-9
+
+_CAMERA_TYPES = {
+    "free": mujoco.mjtCamera.mjCAMERA_FREE,
+    "tracking": mujoco.mjtCamera.mjCAMERA_TRACKING,
+    "fixed": mujoco.mjtCamera.mjCAMERA_FIXED,
+    "user": mujoco.mjtCamera.mjCAMERA_USER,
+}
+"""Camera types that can be selected by name in the record settings."""
+
 
 def simulate_scene(
     scene_id: int,
@@ -119,19 +130,23 @@ def simulate_scene(
         )
 
         if record_settings.camera_type is not None:
-            camera_viewers[-1]._camera.type = dict(
-                free=mujoco.mjtCamera.mjCAMERA_FREE,
-                tracking=mujoco.mjtCamera.mjCAMERA_TRACKING,
-                fixed=mujoco.mjtCamera.mjCAMERA_FIXED,
-                user=mujoco.mjtCamera.mjCAMERA_USER,
-            )[record_settings.camera_type.lower()]
+            camera_viewers[-1]._camera.type = _CAMERA_TYPES[
+                record_settings.camera_type.lower()
+            ]
         else:
             camera_viewers[-1]._camera.type = mujoco.mjtCamera.mjCAMERA_FREE
 
-    """Define some additional control variables."""
-    last_control_time = 0.0
-    last_sample_time = 0.0
-    last_video_time = 0.0  # time at which last video frame was saved
+    """
+    Define some additional control variables.
+    Control, sampling and video frames are scheduled on simulation step indices, not on the accumulated simulation time.
+    """
+    step = 0  # the number of simulation steps taken
+    next_control_step = _next_period_step(step, control_step, simulation_timestep)
+    next_sample_step = (
+        None
+        if sample_step is None
+        else _next_period_step(step, sample_step, simulation_timestep)
+    )
 
     simulation_states: list[SimulationState] = (
         []
@@ -144,16 +159,26 @@ def simulate_scene(
                 f"Selected Viewer {type(viewer).__name__} has no functionality to record."
             )
         video_step = 1 / record_settings.fps
+        next_video_step = _next_period_step(step, video_step, simulation_timestep)
         video_file_path = f"{record_settings.video_directory}/{scene_id}.mp4"
         fourcc = cv2.VideoWriter.fourcc(*"mp4v")
         video_size = ((record_settings.width, record_settings.height)
                       if offscreen_render else
                       viewer.current_viewport_size())
-        video = cv2.VideoWriter(
-            video_file_path,
-            fourcc,
-            record_settings.fps,
-            video_size,
+        video = AsyncVideoWriter(
+            cv2.VideoWriter(
+                video_file_path,
+                fourcc,
+                record_settings.fps,
+                video_size,
+            ),
+            frame_shape=(video_size[1], video_size[0], 3),
+        )
+        # The pixel buffer is reused for every video frame.
+        pixels: npt.NDArray[np.uint8] | None = (
+            None
+            if offscreen_render
+            else np.empty((video_size[1], video_size[0], 3), dtype=np.uint8)
         )
 
     # callbacks = {k: [] for k in Callback}
@@ -170,66 +195,125 @@ def simulate_scene(
     This updates the data so we can read out the initial state.
     """
     mujoco.mj_forward(model, data)
-    images = {
-        camera_id: camera_viewer.process(model, data)
-        for camera_id, camera_viewer in camera_viewers.items()
-    }
 
-    def sample(log=False):
-        _state = SimulationStateImpl(
-            data=data, abstraction_to_mujoco_mapping=mapping, camera_views=images
+    camera_items = tuple(camera_viewers.items())
+
+    def process_cameras() -> dict[int, npt.NDArray[np.uint8]]:
+        # Sampled states keep a reference to the images, so a new dict is needed every time.
+        return {
+            camera_id: camera_viewer.process(model, data)
+            for camera_id, camera_viewer in camera_items
+        }
+
+    images = process_cameras()
+
+    def sample() -> None:
+        simulation_states.append(
+            SimulationStateImpl(
+                data=data, abstraction_to_mujoco_mapping=mapping, camera_views=images
+            )
         )
-        if log:
-            simulation_states.append(_state)
-        return _state
+
+    # The state handed to the controller is only used during the call, so a single one is updated in place.
+    control_state = SimulationStateImpl(
+        data=data, abstraction_to_mujoco_mapping=mapping, camera_views=images
+    )
+
+    # Look the per-step callback lists up once instead of in every iteration.
+    pre_control_callbacks = callbacks[Callback.PRE_CONTROL]
+    post_control_callbacks = callbacks[Callback.POST_CONTROL]
+    pre_step_callbacks = callbacks[Callback.PRE_STEP]
+    post_step_callbacks = callbacks[Callback.POST_STEP]
 
     def control():
-        for _cb in callbacks[Callback.PRE_CONTROL]:
+        for _cb in pre_control_callbacks:
             _cb(model, data)
 
-        scene.handler.handle(sample(), control_interface, control_step)
+        control_state.update(data=data, camera_views=images)
+        scene.handler.handle(control_state, control_interface, control_step)
 
-        for _cb in callbacks[Callback.POST_CONTROL]:
+        for _cb in post_control_callbacks:
             _cb(model, data)
 
     # Sample initial state.
     if sample_step is not None:
-        sample(log=True)
+        sample()
 
     if control_step is not None:
         control()
 
     """After rendering the initial state, we enter the rendering loop."""
-    while (time := data.time) <= (
-        float("inf") if simulation_time is None else simulation_time
-    ):
-        for cb in callbacks[Callback.PRE_STEP]:
+    end_time = float("inf") if simulation_time is None else simulation_time
+    # The final state is sampled after the loop, one step after the last loop iteration.
+    last_step = (
+        None
+        if simulation_time is None
+        else _last_step(simulation_time, simulation_timestep)
+    )
+
+    """
+    Without a viewer, recording, cameras or per-step callbacks, no python code has to run between two control or sample events.
+    MuJoCo then takes all steps up to the next event in a single call.
+    """
+    recording = record_settings is not None
+    fast_forward = (
+        headless
+        and not recording
+        and not camera_items
+        and not pre_step_callbacks
+        and not post_step_callbacks
+    )
+    while data.time <= end_time:
+        for cb in pre_step_callbacks:
             cb(model, data)
 
         # do control if it is time
-        if time >= last_control_time + control_step:
-            last_control_time = math.floor(time / control_step) * control_step
-
+        if step >= next_control_step:
+            next_control_step = _next_period_step(
+                step, control_step, simulation_timestep
+            )
             control()
 
         # sample state if it is time
-        if sample_step is not None:
-            if time >= last_sample_time + sample_step:
-                last_sample_time = int(time / sample_step) * sample_step
-                sample(log=True)
+        if sample_step is not None and next_sample_step is not None:
+            if step >= next_sample_step:
+                next_sample_step = _next_period_step(
+                    step, sample_step, simulation_timestep
+                )
+                # A sample due on the last step would nearly duplicate the final sample.
+                if step != last_step:
+                    sample()
 
-        # step simulation
-        mujoco.mj_step(model, data)
-        # extract images from camera sensors.
-        images = {
-            camera_id: camera_viewer.process(model, data)
-            for camera_id, camera_viewer in camera_viewers.items()
-        }
+        capture_frame = recording and step >= next_video_step
 
-        # render if not headless. also render when recording and if it time for a new video frame.
-        if not headless or (
-            record_settings is not None and time >= last_video_time + video_step
-        ) and not offscreen_render:
+        # step simulation
+        nstep = (
+            _steps_until_next_event(
+                step,
+                next_control_step,
+                next_sample_step,
+                end_time - data.time,
+                simulation_timestep,
+            )
+            if fast_forward
+            else 1
+        )
+        mujoco.mj_step(model, data, nstep)
+        step += nstep
+        # extract images from camera sensors, but only if something will read them before the next step:
+        # control or sampling in the next iteration, the final sample, the offscreen video frame, or the viewer.
+        if camera_items and (
+            not headless
+            or data.time > end_time
+            or step >= next_control_step
+            or (next_sample_step is not None and step >= next_sample_step)
+            or (offscreen_render and capture_frame)
+        ):
+            images = process_cameras()
+
+        # render if not headless.
+        # Recording with a viewer implies not headless, and headless recording renders offscreen, so there is no other case.
+        if not headless:
             _status = viewer.render(callbacks)
 
             # Check if simulation was closed
@@ -237,31 +321,32 @@ def simulate_scene(
                 break
 
         # capture video frame if it's time
-        if record_settings is not None and time >= last_video_time + video_step:
-            last_video_time = int(time / video_step) * video_step
+        if capture_frame:
+            next_video_step = _next_period_step(
+                step - 1, video_step, simulation_timestep
+            )
 
             if offscreen_render:
                 img = images[-1]
 
             else:
+                assert pixels is not None
                 # https://github.com/deepmind/mujoco/issues/285 (see also record.cc)
-                img: npt.NDArray[np.uint8] = np.empty(
-                    (video_size[1], video_size[0], 3),
-                    dtype=np.uint8,
-                )
-
                 mujoco.mjr_readPixels(
-                    rgb=img,
+                    rgb=pixels,
                     depth=None,
                     viewport=viewer.view_port,
                     con=viewer.context,
                 )
+                img = pixels
 
-            # Flip the image and map to OpenCV colormap (BGR -> RGB)
-            img = np.flipud(img)[:, :, ::-1]
-            video.write(img)
+            # Flip the image and map to OpenCV colormap (RGB -> BGR), in place in the frame buffer.
+            video_frame = video.next_frame()
+            cv2.flip(img, 0, dst=video_frame)
+            cv2.cvtColor(video_frame, cv2.COLOR_RGB2BGR, dst=video_frame)
+            video.write(video_frame)
 
-        for cb in callbacks[Callback.POST_STEP]:
+        for cb in post_step_callbacks:
             cb(model, data)
 
     for cb in callbacks[Callback.END]:
@@ -280,10 +365,68 @@ def simulate_scene(
 
     # Sample one final time.
     if sample_step is not None:
-        sample(log=True)
+        sample()
 
     for camera_viewer in camera_viewers.values():
         camera_viewer.free()
 
     logging.info(f"Scene {scene_id} done.")
     return simulation_states
+
+
+def _next_period_step(step: int, period: float, timestep: float) -> int:
+    """
+    Get the index of the first simulation step of the period following the one the given step is in.
+
+    Periods that are skipped entirely, because they are shorter than the timestep, are not caught up on.
+
+    :param step: The current simulation step.
+    :param period: The duration of a period. In seconds.
+    :param timestep: The duration of a simulation step. In seconds.
+    :returns: The step index.
+    """
+    # The tolerance absorbs rounding in the divisions, e.g. 0.2 / 0.001 = 200.00000000000003.
+    next_period = math.floor(step * timestep / period + _STEP_TOLERANCE) + 1
+    return math.ceil(next_period * period / timestep - _STEP_TOLERANCE)
+
+
+def _last_step(simulation_time: float, timestep: float) -> int:
+    """
+    Get the index of the last simulation step that starts within the simulation time.
+
+    :param simulation_time: How long the simulation runs for. In seconds.
+    :param timestep: The duration of a simulation step. In seconds.
+    :returns: The step index.
+    """
+    return math.floor(simulation_time / timestep + _STEP_TOLERANCE)
+
+
+def _steps_until_next_event(
+    step: int,
+    next_control_step: int,
+    next_sample_step: int | None,
+    time_left: float,
+    timestep: float,
+) -> int:
+    """
+    Get the number of simulation steps that can be taken before python code has to run again.
+
+    The steps are bounded by the next control or sample event.
+    They stay a step clear of the end of the simulation, so the last steps are taken one at a time and the loop ends exactly when it would otherwise.
+
+    :param step: The current simulation step.
+    :param next_control_step: The step at which control is next due.
+    :param next_sample_step: The step at which sampling is next due, or None if the state is not sampled.
+    :param time_left: The simulation time until the end of the simulation. In seconds.
+    :param timestep: The duration of a simulation step. In seconds.
+    :returns: The number of steps, at least one.
+    """
+    next_event_step = (
+        next_control_step
+        if next_sample_step is None
+        else min(next_control_step, next_sample_step)
+    )
+    nstep = next_event_step - step
+    if time_left != float("inf"):
+        nstep = min(nstep, int(time_left / timestep) - 1)
+    return max(nstep, 1)
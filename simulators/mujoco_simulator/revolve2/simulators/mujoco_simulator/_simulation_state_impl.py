@@ -49,6 +49,24 @@ class SimulationStateImpl(SimulationState):
         self._abstraction_to_mujoco_mapping = abstraction_to_mujoco_mapping
         self._camera_views = camera_views
 
+    def update(
+        self, data: mujoco.MjData, camera_views: dict[int, npt.NDArray[np.uint8]]
+    ) -> None:
+        """
+        Overwrite this state with the current state of the simulation.
+
+        This reuses the buffers of this state instead of allocating new ones.
+        Anyone still holding this state will see the new values.
+
+        :param data: The data to copy from. Must belong to the same model as the data this state was created from.
+        :param camera_views: The camera views.
+        """
+        np.copyto(self._xpos, data.xpos)
+        np.copyto(self._xquat, data.xquat)
+        np.copyto(self._qpos, data.qpos)
+        np.copyto(self._sensordata, data.sensordata)
+        self._camera_views = camera_views
+
     def get_rigid_body_relative_pose(self, rigid_body: RigidBody) -> Pose:
         """
         Get the pose of a rigid body, relative to its parent multi-body system's reference frame.
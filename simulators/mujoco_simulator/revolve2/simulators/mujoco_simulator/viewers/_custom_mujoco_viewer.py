@@ -1,4 +1,5 @@
 """A custom viewer for mujoco with additional features."""
+import math
 import time
 from collections import defaultdict
 from enum import Enum
@@ -13,6 +14,18 @@ from revolve2.simulation.simulator._simulator import Callback
 
 from .._render_backend import RenderBackend
 
+_MENU_POSITIONS = (
+    mujoco.mjtGridPos.mjGRID_TOPLEFT,
+    mujoco.mjtGridPos.mjGRID_BOTTOMLEFT,
+)
+"""Overlay positions that are part of the menus, which are not drawn while menus are hidden."""
+
+_FPS_REFRESH_PERIOD = 0.5
+"""Minimum wall-clock time between updates of the FPS overlay. In seconds."""
+
+_PAUSED_EVENT_TIMEOUT = 1 / 60
+"""Maximum wall-clock time to wait for window events while paused. In seconds."""
+
 
 class CustomMujocoViewerMode(Enum):
     """
@@ -35,6 +48,7 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
 
     _position: int
     _viewer_mode: CustomMujocoViewerMode
+    _add_mode_overlays: Callable[[], None]
 
     def __init__(
         self,
@@ -46,6 +60,7 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         viewer_mode: CustomMujocoViewerMode,
         start_paused: bool,
         render_every_frame: bool,
+        vsync: bool,
     ) -> None:
         """
         Initialize the MujocoViewer backend.
@@ -58,6 +73,7 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         :param viewer_mode: The viewer mode.
         :param start_paused: Whether to start paused.
         :param render_every_frame: Whether to render every frame.
+        :param vsync: Whether to synchronize buffer swaps with the display refresh.
         """
 
         super().__init__(
@@ -69,8 +85,16 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
             height=height,
             hide_menus=hide_menus,
         )
+        # MujocoViewer enables V-Sync, which makes every buffer swap block until the next display refresh.
+        # The simulation paces itself, so by default the swaps do not wait.
+        glfw.swap_interval(1 if vsync else 0)
         self._position = 0
         self._viewer_mode = viewer_mode
+        # The mode is fixed, so its overlays are selected once instead of every frame.
+        self._add_mode_overlays = {
+            CustomMujocoViewerMode.MANUAL: self._add_manual_overlays,
+            CustomMujocoViewerMode.CLASSIC: self._add_classic_overlays,
+        }[viewer_mode]
 
         """MujocoViewer attributes."""
         self._paused = start_paused
@@ -78,23 +102,117 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         self._render_every_frame = render_every_frame
 
         self._overlays = []
-        self._callbacks = {}
+        # Key release handlers, with user callbacks registered next to the built-in bindings.
+        self._callbacks = {glfw.KEY_K: self._increment_position}
+        self._overlay_lines: defaultdict[int, tuple[list[str], list[str]]] = (
+            defaultdict(lambda: ([], []))
+        )
+        self._fps_text = ""
+        self._fps_updated_at = -math.inf
+        self._overlay_dirty = True
+        self._overlay_time = -math.inf
+
+        # The framebuffer size is tracked through its resize callback, instead of querying GLFW every frame.
+        self._framebuffer_size = glfw.get_framebuffer_size(self.window)
+        glfw.set_framebuffer_size_callback(self.window, self._framebuffer_size_callback)
+        self._update_figure_viewports()
+        # While paused, the scene is only redrawn after an event that can change what is shown.
+        self._redraw_needed = True
+        glfw.set_window_refresh_callback(self.window, self._window_refresh_callback)
+        # Nothing is drawn while the window is minimized.
+        self._iconified = bool(glfw.get_window_attrib(self.window, glfw.ICONIFIED))
+        glfw.set_window_iconify_callback(self.window, self._window_iconify_callback)
+        # The timestep and overlay labels only depend on the model, so they are read and formatted once.
+        self._timestep = model.opt.timestep
+        self._timestep_label = "%.5f" % self._timestep
+        self._switch_camera_label = "Switch camera (#cams = %d)" % (model.ncam + 1)
+        self._format_key_labels()
 
     def render(self, callbacks) -> int | None:
         """
         Render the scene.
 
-        :return: A cycle position if applicable.
+        :return: A cycle position if applicable, or -1 once the viewer is closed.
         """
         if self.is_alive:
             self._render(callbacks)
-            # super().render()
-        else:
+        # Rendering closes the viewer when its window is closed, so this is checked afterwards.
+        if not self.is_alive:
             return -1
         if self._viewer_mode == CustomMujocoViewerMode.MANUAL:
             return self._position
         return None
 
+    @property
+    def framebuffer_size(self) -> tuple[int, int]:
+        """
+        Get the current size of the window's framebuffer.
+
+        :returns: The width and height, in pixels.
+        """
+        return self._framebuffer_size
+
+    def _framebuffer_size_callback(self, window: Any, width: int, height: int) -> None:
+        """
+        Track the framebuffer size when the window is resized.
+
+        :param window: The window.
+        :param width: The new width, in pixels.
+        :param height: The new height, in pixels.
+        """
+        self._framebuffer_size = (width, height)
+        self._update_figure_viewports()
+        self._redraw_needed = True
+
+    def _update_figure_viewports(self) -> None:
+        """Lay out the figures in a column on the right side of the framebuffer."""
+        width, height = self._framebuffer_size
+        x = int(3 * width / 4) + width % 4
+        self._figure_viewports = [
+            mujoco.MjrRect(x, idx * int(height / 4), int(width / 4), int(height / 4))
+            for idx in range(len(self.figs))
+        ]
+
+    def _window_refresh_callback(self, window: Any) -> None:
+        """
+        Request a redraw when the window contents are damaged.
+
+        :param window: The window.
+        """
+        self._redraw_needed = True
+
+    def _window_iconify_callback(self, window: Any, iconified: int) -> None:
+        """
+        Track whether the window is minimized.
+
+        :param window: The window.
+        :param iconified: Whether the window was minimized, or restored otherwise.
+        """
+        self._iconified = bool(iconified)
+        self._redraw_needed = True
+
+    def _cursor_pos_callback(self, window: Any, xpos: float, ypos: float) -> None:
+        """
+        Add a redraw request to the cursor position callback of the MujocoViewer.
+
+        :param window: The window.
+        :param xpos: The cursor x position.
+        :param ypos: The cursor y position.
+        """
+        super()._cursor_pos_callback(window, xpos, ypos)
+        self._redraw_needed = True
+
+    def _scroll_callback(self, window: Any, x_offset: float, y_offset: float) -> None:
+        """
+        Add a redraw request to the scroll callback of the MujocoViewer.
+
+        :param window: The window.
+        :param x_offset: The horizontal scroll offset.
+        :param y_offset: The vertical scroll offset.
+        """
+        super()._scroll_callback(window, x_offset, y_offset)
+        self._redraw_needed = True
+
     def _add_overlay(self, gridpos: int, text1: str, text2: str) -> None:
         """
         Add overlays (This overwrites the MujocoViewer._add_overlay method).
@@ -103,38 +221,58 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         :param text1: Some text.
         :param text2: Additional text.
         """
-        if gridpos not in self._overlay:
-            self._overlay[gridpos] = ["", ""]
-        self._overlay[gridpos][0] += text1 + "\n"
-        self._overlay[gridpos][1] += text2 + "\n"
+        lines1, lines2 = self._overlay_lines[gridpos]
+        lines1.append(text1)
+        lines2.append(text2)
+
+    def _overlay_outdated(self) -> bool:
+        """
+        Check whether anything shown in the overlay may have changed since it was last created.
+
+        Frames drawn while paused or in slow motion show the same simulation state, so their overlay can be reused.
+        Everything else it shows is changed through keys, or is the periodically refreshed FPS.
+
+        :returns: Whether the overlay should be recreated.
+        """
+        return (
+            self._overlay_dirty
+            or self.data.time != self._overlay_time
+            or (
+                not self._hide_menus
+                and time.monotonic() - self._fps_updated_at >= _FPS_REFRESH_PERIOD
+            )
+        )
 
     def _create_overlay(self) -> None:
-        """Create a Custom Overlay (This overwrites the MujocoViewer._create_overlay method)."""
+        """
+        Create a Custom Overlay (This overwrites the MujocoViewer._create_overlay method).
+
+        The lines are collected per grid position and joined once, instead of growing the overlay strings line by line.
+        """
+        self._overlay_dirty = False
+        self._overlay_time = self.data.time
+        self._overlay_lines.clear()
+
+        # Menu overlays would not be drawn, so only build the custom overlays placed elsewhere.
+        if not self._hide_menus:
+            self._add_menu_overlays()
+        for position, label, getter in self._overlays:
+            if not self._hide_menus or position not in _MENU_POSITIONS:
+                self._add_overlay(position, label, getter())
+
+        self._overlay = {
+            gridpos: ["\n".join(lines1), "\n".join(lines2)]
+            for gridpos, (lines1, lines2) in self._overlay_lines.items()
+        }
+
+    def _add_menu_overlays(self) -> None:
+        """Add the overlays of the menus."""
         topleft = mujoco.mjtGridPos.mjGRID_TOPLEFT
         # topright = mujoco.mjtGridPos.mjGRID_TOPRIGHT
         bottomleft = mujoco.mjtGridPos.mjGRID_BOTTOMLEFT
         # bottomright = mujoco.mjtGridPos.mjGRID_BOTTOMRIGHT
 
-        match self._viewer_mode.value:
-            case "manual":
-                self._add_overlay(topleft, "Iterate position", "[K]")
-                self._add_overlay(bottomleft, "position", str(self._position + 1))
-            case "classic":
-                self._add_overlay(
-                    topleft, "[C]ontact forces", "On" if self._contacts else "Off"
-                )
-                self._add_overlay(topleft, "[J]oints", "On" if self._joints else "Off")
-                self._add_overlay(
-                    topleft, "[G]raph Viewer", "Off" if self._hide_graph else "On"
-                )
-                self._add_overlay(
-                    topleft, "[I]nertia", "On" if self._inertias else "Off"
-                )
-                self._add_overlay(
-                    topleft, "Center of [M]ass", "On" if self._com else "Off"
-                )
-            case _:
-                print("Didnt reach anything with mode: " + self._viewer_mode.value)
+        self._add_mode_overlays()
 
         """These are default overlays, only change if you know what you are doing."""
         if self._render_every_frame:
@@ -142,7 +280,7 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         else:
             self._add_overlay(
                 topleft,
-                "Run speed = %.3f x real time" % self._run_speed,
+                self._run_speed_label,
                 "[S]lower, [F]aster",
             )
         self._add_overlay(
@@ -150,7 +288,7 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         )
         self._add_overlay(
             topleft,
-            "Switch camera (#cams = %d)" % (self.model.ncam + 1),
+            self._switch_camera_label,
             "[Tab] (camera ID = %d)" % self.cam.fixedcamid,
         )
 
@@ -175,7 +313,7 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         self._add_overlay(
             topleft,
             "Toggle geomgroup visibility (0-5)",
-            ",".join(["On" if g else "Off" for g in self.vopt.geomgroup]),
+            self._geomgroup_label,
         )
         self._add_overlay(
             topleft, "Referenc[e] frames", mujoco.mjtFrame(self.vopt.frame).name
@@ -187,11 +325,15 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         else:
             self._add_overlay(topleft, "Cap[t]ure frame", "")
 
-        self._add_overlay(bottomleft, "FPS", "%d%s" % (1 / self._time_per_render, ""))
+        # Nobody can read the FPS at the frame rate, so it is only reformatted a few times per second.
+        if (now := time.monotonic()) - self._fps_updated_at >= _FPS_REFRESH_PERIOD:
+            self._fps_text = "%d" % (1 / self._time_per_render)
+            self._fps_updated_at = now
+        self._add_overlay(bottomleft, "FPS", self._fps_text)
 
         if self._mujoco_version >= (3, 0, 0):
             self._add_overlay(
-                bottomleft, "Max solver iters", str(max(self.data.solver_niter) + 1)
+                bottomleft, "Max solver iters", str(self.data.solver_niter.max() + 1)
             )
         else:
             self._add_overlay(
@@ -199,13 +341,30 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
             )
 
         self._add_overlay(
-            bottomleft, "Step", str(round(self.data.time / self.model.opt.timestep))
+            bottomleft, "Step", str(round(self.data.time / self._timestep))
         )
-        self._add_overlay(bottomleft, "timestep", "%.5f" % self.model.opt.timestep)
+        self._add_overlay(bottomleft, "timestep", self._timestep_label)
         self._add_overlay(bottomleft, "Time", "%gs" % self.data.time)
 
-        for position, label, getter in self._overlays:
-            self._add_overlay(position, label, getter())
+    def _add_manual_overlays(self) -> None:
+        """Add the overlays specific to the manual viewer mode."""
+        self._add_overlay(mujoco.mjtGridPos.mjGRID_TOPLEFT, "Iterate position", "[K]")
+        self._add_overlay(
+            mujoco.mjtGridPos.mjGRID_BOTTOMLEFT, "position", str(self._position + 1)
+        )
+
+    def _add_classic_overlays(self) -> None:
+        """Add the overlays specific to the classic viewer mode."""
+        topleft = mujoco.mjtGridPos.mjGRID_TOPLEFT
+        self._add_overlay(
+            topleft, "[C]ontact forces", "On" if self._contacts else "Off"
+        )
+        self._add_overlay(topleft, "[J]oints", "On" if self._joints else "Off")
+        self._add_overlay(
+            topleft, "[G]raph Viewer", "Off" if self._hide_graph else "On"
+        )
+        self._add_overlay(topleft, "[I]nertia", "On" if self._inertias else "Off")
+        self._add_overlay(topleft, "Center of [M]ass", "On" if self._com else "Off")
 
     def add_callback(self, position: mujoco.mjtGridPos, label: str, key: Any,
                      getter: Callable, setter: Callable):
@@ -227,17 +386,21 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         :param mods: The Mods.
         """
         super()._key_callback(window, key, scancode, action, mods)
+        self._format_key_labels()
+        self._overlay_dirty = True
+        self._redraw_needed = True
         if action != glfw.RELEASE:
             if key == glfw.KEY_LEFT_ALT:
                 self._hide_menus = False
-        else:
-            match key:
-                case glfw.KEY_K:  # Increment cycle position
-                    self._increment_position()
-                case _:
-                    pass
-            if (fn := self._callbacks.get(key, None)) is not None:
-                fn()
+        elif (fn := self._callbacks.get(key, None)) is not None:
+            fn()
+
+    def _format_key_labels(self) -> None:
+        """Format the overlay labels of settings that are only changed from the keyboard."""
+        self._run_speed_label = "Run speed = %.3f x real time" % self._run_speed
+        self._geomgroup_label = ",".join(
+            ["On" if g else "Off" for g in self.vopt.geomgroup]
+        )
 
     def _increment_position(self) -> None:
         """Increment our cycle position."""
@@ -254,8 +417,14 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
             return
 
         if self._paused:
+            # Draw the state reached when pausing, then sleep until an event requires a redraw.
+            self._redraw_needed = True
             while self._paused:
-                self._update(callbacks)
+                if self._redraw_needed and not self._iconified:
+                    self._redraw_needed = False
+                    self._update(callbacks)
+                else:
+                    glfw.wait_events_timeout(_PAUSED_EVENT_TIMEOUT)
                 if glfw.window_should_close(self.window):
                     self.close()
                     break
@@ -263,18 +432,25 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
                     self._advance_by_one_step = False
                     break
         else:
-            self._loop_count += self.model.opt.timestep / \
+            self._loop_count += self._timestep / \
                                 (self._time_per_render * self._run_speed)
             # print("[kgd-debug] _render():", self._loop_count, self._time_per_render, self._run_speed)
 
             if self._render_every_frame:
                 self._loop_count = 1
-            while self._loop_count > 0:
-                self._update(callbacks)
-                self._loop_count -= 1
+            if self._iconified and not self._render_every_frame:
+                # Drop the frames nobody would see, but keep handling events to notice the window being restored.
+                self._loop_count = 0
+                glfw.poll_events()
+            elif self._loop_count > 0:
+                while self._loop_count > 0:
+                    self._update(callbacks)
+                    self._loop_count -= 1
+                # Key presses only latch flags, so events are handled once after the frames instead of after each.
+                glfw.poll_events()
 
         # clear markers
-        self._markers[:] = []
+        self._markers.clear()
 
         # apply perturbation (should this come before mj_step?)
         self.apply_perturbations()
@@ -284,11 +460,13 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
         render_start = time.time()
 
         # fill overlay items
-        self._create_overlay()
+        if self._overlay_outdated():
+            self._create_overlay()
 
-        width, height = glfw.get_framebuffer_size(self.window)
-        self.viewport.width, self.viewport.height = width, height
+        self.viewport.width, self.viewport.height = self._framebuffer_size
 
+        # The lock guards the scene and camera, which the mouse callbacks also move.
+        # Overlays, figures and the buffer swap only use the rendering context, so they run without it.
         with self._gui_lock:
             for cb in callbacks[Callback.PRE_RENDER]:
                 cb(self.model, self.data, self)
@@ -309,46 +487,35 @@ class _MujocoViewerBackend(mujoco_viewer.MujocoViewer):  # type: ignore
                 self._add_marker_to_scene(marker)
             # render
             mujoco.mjr_render(self.viewport, self.scn, self.ctx)
-            # overlay items
-            for gridpos, [t1, t2] in self._overlay.items():
-                menu_positions = [mujoco.mjtGridPos.mjGRID_TOPLEFT,
-                                  mujoco.mjtGridPos.mjGRID_BOTTOMLEFT]
-                if gridpos in menu_positions and self._hide_menus:
-                    continue
-
-                mujoco.mjr_overlay(
-                    mujoco.mjtFontScale.mjFONTSCALE_150,
-                    gridpos,
-                    self.viewport,
-                    t1[:-1],
-                    t2[:-1],
-                    self.ctx)
-
-            # handle figures
-            if not self._hide_graph:
-                for idx, fig in enumerate(self.figs):
-                    width_adjustment = width % 4
-                    x = int(3 * width / 4) + width_adjustment
-                    y = idx * int(height / 4)
-                    viewport = mujoco.MjrRect(
-                        x, y, int(width / 4), int(height / 4))
-
-                    has_lines = len([i for i in fig.linename if i != b''])
-                    if has_lines:
-                        mujoco.mjr_figure(viewport, fig, self.ctx)
-
-            for cb in callbacks[Callback.POST_RENDER]:
-                cb(self.model, self.data, self)
 
-            glfw.swap_buffers(self.window)
+        # overlay items
+        # Hiding the menus always rebuilds the overlay, which then has no menu positions left to skip.
+        for gridpos, [t1, t2] in self._overlay.items():
+            mujoco.mjr_overlay(
+                mujoco.mjtFontScale.mjFONTSCALE_150,
+                gridpos,
+                self.viewport,
+                t1,
+                t2,
+                self.ctx)
+
+        # handle figures
+        if not self._hide_graph:
+            for fig, viewport in zip(self.figs, self._figure_viewports):
+                # Lines are added in order, so a figure has lines if its first one is named.
+                if fig.linename[0] != b'':
+                    mujoco.mjr_figure(viewport, fig, self.ctx)
+
+        if post_render := callbacks[Callback.POST_RENDER]:
+            with self._gui_lock:
+                for cb in post_render:
+                    cb(self.model, self.data, self)
+
+        glfw.swap_buffers(self.window)
 
-        glfw.poll_events()
         self._time_per_render = (0.9 * self._time_per_render +
                                  0.1 * (time.time() - render_start))
 
-        # clear overlay
-        self._overlay.clear()
-
 
 class CustomMujocoViewer(Viewer):
     """Custom Viewer Object that allows for additional keyboard inputs."""
@@ -377,6 +544,7 @@ class CustomMujocoViewer(Viewer):
         render_every_frame: bool = False,
         hide_menus: bool = False,
         mode: CustomMujocoViewerMode = CustomMujocoViewerMode.CLASSIC,
+        vsync: bool = False,
         **_: Any,
     ):
         """
@@ -391,6 +559,7 @@ class CustomMujocoViewer(Viewer):
         :param render_every_frame: If every frame is rendered or not.
         :param hide_menus: Start with hidden menus?
         :param mode: The mode of the viewer (classic, manual).
+        :param vsync: If buffer swaps wait for the display refresh or not.
         :param _: Some unused kwargs.
         """
 
@@ -411,6 +580,7 @@ class CustomMujocoViewer(Viewer):
             viewer_mode=mode,
             start_paused=start_paused,
             render_every_frame=render_every_frame,
+            vsync=vsync,
         )
 
     def current_viewport_size(self) -> tuple[int, int]:
@@ -419,10 +589,9 @@ class CustomMujocoViewer(Viewer):
 
         :return: the viewport size
         """
-        self._viewer_backend.viewport.width, self._viewer_backend.height = (
-            glfw.get_framebuffer_size(self._viewer_backend.window)
-        )
-        return self._viewer_backend.viewport.width, self._viewer_backend.height
+        viewport = self._viewer_backend.viewport
+        viewport.width, viewport.height = self._viewer_backend.framebuffer_size
+        return viewport.width, viewport.height
 
     def render(self, callbacks=None) -> int | None:
         """
@@ -1,14 +1,25 @@
+import threading
+
 import multineat
 import numpy as np
 
+_thread_local = threading.local()
+
 
 def multineat_rng_from_random(rng: np.random.Generator) -> multineat.RNG:
     """
     Create a multineat rng object from a numpy rng state.
 
+    Constructing a multineat rng is expensive compared to seeding it,
+    so a single multineat rng is kept per thread and reseeded on every call.
+    The returned rng is therefore only valid until the next call to this function from the same thread.
+
     :param rng: The numpy rng.
     :returns: The multineat rng.
     """
-    multineat_rng = multineat.RNG()
+    multineat_rng: multineat.RNG | None = getattr(_thread_local, "multineat_rng", None)
+    if multineat_rng is None:
+        multineat_rng = multineat.RNG()
+        _thread_local.multineat_rng = multineat_rng
     multineat_rng.Seed(rng.integers(0, 2**31))
     return multineat_rng
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import zlib
+
 import multineat
 import numpy as np
 import sqlalchemy.orm as orm
@@ -24,7 +26,8 @@ class BrainGenotypeCpgOrm(orm.MappedAsDataclass, kw_only=True):
 
     brain: multineat.Genome
 
-    _serialized_brain: orm.Mapped[str] = orm.mapped_column(
+    # Zlib-compressed multineat serialization of the genome.
+    _serialized_brain: orm.Mapped[bytes] = orm.mapped_column(
         "serialized_brain", init=False, nullable=False
     )
 
@@ -125,11 +128,16 @@ def _serialize_brain(
     connection: Connection,
     target: BrainGenotypeCpgOrm,
 ) -> None:
-    target._serialized_brain = target.brain.Serialize()
+    # A genotype never changes its genome after creation (mutation and crossover create new genotypes),
+    # so it only has to be serialized the first time it is written to the database.
+    if target._serialized_brain is None:
+        target._serialized_brain = zlib.compress(
+            target.brain.Serialize().encode(), level=1
+        )
 
 
 @event.listens_for(BrainGenotypeCpgOrm, "load", propagate=True)
 def _deserialize_brain(target: BrainGenotypeCpgOrm, context: orm.QueryContext) -> None:
     brain = multineat.Genome()
-    brain.Deserialize(target._serialized_brain)
+    brain.Deserialize(zlib.decompress(target._serialized_brain).decode())
     target.brain = brain
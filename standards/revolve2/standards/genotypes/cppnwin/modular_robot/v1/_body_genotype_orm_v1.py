@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import zlib
+
 import multineat
 import numpy as np
 import sqlalchemy.orm as orm
@@ -23,7 +25,8 @@ class BodyGenotypeOrmV1(orm.MappedAsDataclass, kw_only=True):
 
     body: multineat.Genome
 
-    _serialized_body: orm.Mapped[str] = orm.mapped_column(
+    # Zlib-compressed multineat serialization of the genome.
+    _serialized_body: orm.Mapped[bytes] = orm.mapped_column(
         "serialized_body", init=False, nullable=False
     )
 
@@ -123,11 +126,16 @@ def _update_serialized_body(
     connection: Connection,
     target: BodyGenotypeOrmV1,
 ) -> None:
-    target._serialized_body = target.body.Serialize()
+    # A genotype never changes its genome after creation (mutation and crossover create new genotypes),
+    # so it only has to be serialized the first time it is written to the database.
+    if target._serialized_body is None:
+        target._serialized_body = zlib.compress(
+            target.body.Serialize().encode(), level=1
+        )
 
 
 @event.listens_for(BodyGenotypeOrmV1, "load", propagate=True)
 def _deserialize_body(target: BodyGenotypeOrmV1, context: orm.QueryContext) -> None:
     body = multineat.Genome()
-    body.Deserialize(target._serialized_body)
+    body.Deserialize(zlib.decompress(target._serialized_body).decode())
     target.body = body
@@ -0,0 +1,43 @@
+import numpy as np
+
+from revolve2.experimentation.optimization.ea.selection import batched_tournament
+
+
+def test_batched_tournament_shape() -> None:
+    """Test that one winner is returned per tournament."""
+    rng = np.random.default_rng(0)
+    fitnesses = rng.random(20)
+
+    winners = batched_tournament(rng, fitnesses, k=3, n=50)
+
+    assert winners.shape == (50,)
+    assert np.all((winners >= 0) & (winners < len(fitnesses)))
+
+
+def test_batched_tournament_winners_are_fittest_participants() -> None:
+    """Test that each winner has the highest fitness among the participants drawn for its tournament."""
+    fitnesses = np.random.default_rng(1).permutation(30).astype(float)
+    n, k = 100, 4
+
+    winners = batched_tournament(np.random.default_rng(2), fitnesses, k=k, n=n)
+    # The same seed draws the same participants.
+    participants = np.random.default_rng(2).integers(0, len(fitnesses), size=(n, k))
+
+    for winner, drawn in zip(winners, participants):
+        assert winner in drawn
+        assert fitnesses[winner] == fitnesses[drawn].max()
+
+
+def test_batched_tournament_k1_is_uniform() -> None:
+    """Test that tournaments of a single participant select uniformly at random."""
+    fitnesses = np.arange(10, dtype=float)
+    n = 10000
+
+    winners = batched_tournament(np.random.default_rng(3), fitnesses, k=1, n=n)
+
+    # Without competition, the winners are the participants themselves.
+    expected = np.random.default_rng(3).integers(0, len(fitnesses), size=(n, 1))[:, 0]
+    assert np.array_equal(winners, expected)
+    # Fitness does not bias the draw: every individual wins about equally often.
+    counts = np.bincount(winners, minlength=len(fitnesses))
+    assert np.all(np.abs(counts / n - 1 / len(fitnesses)) < 0.02)
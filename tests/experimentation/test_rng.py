@@ -0,0 +1,31 @@
+import numpy as np
+
+from revolve2.experimentation.rng import make_rngs
+
+
+def test_make_rngs_count() -> None:
+    """Test that the requested number of generators is created."""
+    assert len(make_rngs(seed=0, num_rngs=5)) == 5
+    assert make_rngs(seed=0, num_rngs=0) == []
+
+
+def test_make_rngs_reproducible() -> None:
+    """Test that the same seed creates generators with the same streams."""
+    first = [rng.random(100) for rng in make_rngs(seed=1234, num_rngs=4)]
+    second = [rng.random(100) for rng in make_rngs(seed=1234, num_rngs=4)]
+
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+
+
+def test_make_rngs_independent() -> None:
+    """Test that the generators produce different, uncorrelated streams."""
+    streams = np.array([rng.random(10000) for rng in make_rngs(seed=1234, num_rngs=4)])
+
+    assert len({stream.tobytes() for stream in streams}) == len(streams)
+    correlations = np.corrcoef(streams)
+    off_diagonal = correlations[~np.eye(len(streams), dtype=bool)]
+    assert np.all(np.abs(off_diagonal) < 0.05)
+    # A different seed gives different streams as well.
+    other = make_rngs(seed=4321, num_rngs=1)[0].random(10000)
+    assert not np.array_equal(other, streams[0])
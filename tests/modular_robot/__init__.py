@@ -0,0 +1 @@
+"""Unit tests for the modular robot package."""
@@ -0,0 +1,94 @@
+from unittest.mock import Mock
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from revolve2.modular_robot.brain.cpg import BrainCpgInstance
+
+
+def _reference_rk45(
+    state: npt.NDArray[np.float_], A: npt.NDArray[np.float_], dt: float
+) -> npt.NDArray[np.float_]:
+    """
+    Calculate the next state using the stage-by-stage RK45 integration the step matrix replaces.
+
+    :param state: The current state of the network.
+    :param A: The weights matrix of the network.
+    :param dt: The step size.
+    :returns: The new state.
+    """
+    A1 = np.matmul(A, state)
+    A2 = np.matmul(A, (state + dt / 2 * A1))
+    A3 = np.matmul(A, (state + dt / 2 * A2))
+    A4 = np.matmul(A, (state + dt * A3))
+    state = state + dt / 6 * (A1 + 2 * (A2 + A3) + A4)
+    return np.clip(state, a_min=-1, a_max=1)
+
+
+@pytest.mark.parametrize("dt", [0.001, 1 / 60, 0.05, 0.1])
+def test_brain_cpg_instance_matches_stage_by_stage_rk45(dt: float) -> None:
+    """
+    Test that integrating with the step matrix follows the stage-by-stage RK45 integration.
+
+    :param dt: The step size.
+    """
+    num_neurons = 8
+    num_steps = 500
+    rng = np.random.default_rng(0)
+    weight_matrix = rng.uniform(-1.0, 1.0, (num_neurons, num_neurons))
+    initial_state = rng.uniform(-0.5, 0.5, num_neurons)
+
+    # Every neuron is an output with a range of 1, so the targets are the state itself.
+    hinges = [Mock(range=1.0) for _ in range(num_neurons)]
+    brain = BrainCpgInstance(
+        initial_state=initial_state,
+        weight_matrix=weight_matrix,
+        output_mapping=list(enumerate(hinges)),
+    )
+    control_interface = Mock()
+
+    expected = initial_state.copy()
+    for _ in range(num_steps):
+        control_interface.reset_mock()
+        brain.control(dt, Mock(), control_interface)
+        expected = _reference_rk45(expected, weight_matrix, dt)
+
+        targets = {
+            call.args[0]: call.args[1]
+            for call in control_interface.set_active_hinge_target.call_args_list
+        }
+        actual = np.array([targets[hinge] for hinge in hinges])
+        np.testing.assert_allclose(actual, expected, rtol=0.0, atol=1e-12)
+
+
+def test_brain_cpg_instance_varying_dt_matches_stage_by_stage_rk45() -> None:
+    """Test integration with a step size that changes every call, as measured on physical robots."""
+    num_neurons = 8
+    rng = np.random.default_rng(1)
+    weight_matrix = rng.uniform(-1.0, 1.0, (num_neurons, num_neurons))
+    initial_state = rng.uniform(-0.5, 0.5, num_neurons)
+    # Mostly changing step sizes, with some repeats in between that switch to the step matrix.
+    dts = np.concatenate([rng.uniform(0.01, 0.03, 200), np.full(20, 0.02)])
+    rng.shuffle(dts)
+
+    hinges = [Mock(range=1.0) for _ in range(num_neurons)]
+    brain = BrainCpgInstance(
+        initial_state=initial_state,
+        weight_matrix=weight_matrix,
+        output_mapping=list(enumerate(hinges)),
+    )
+    control_interface = Mock()
+
+    expected = initial_state.copy()
+    for dt in dts:
+        control_interface.reset_mock()
+        brain.control(float(dt), Mock(), control_interface)
+        expected = _reference_rk45(expected, weight_matrix, float(dt))
+
+        targets = {
+            call.args[0]: call.args[1]
+            for call in control_interface.set_active_hinge_target.call_args_list
+        }
+        actual = np.array([targets[hinge] for hinge in hinges])
+        np.testing.assert_allclose(actual, expected, rtol=0.0, atol=1e-12)
@@ -0,0 +1,119 @@
+import threading
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from revolve2.simulators.mujoco_simulator._async_video_writer import AsyncVideoWriter
+
+_FRAME_SHAPE = (4, 6, 3)
+
+
+class _FakeVideoWriter:
+    """Stands in for `cv2.VideoWriter`, recording what is written to it."""
+
+    frames: list[npt.NDArray[np.uint8]]
+    buffer_ids: list[int]
+    released: bool
+    write_allowed: threading.Event
+    error: Exception | None
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """
+        Initialize this object.
+
+        :param error: An error to raise when writing a frame, if any.
+        """
+        self.frames = []
+        self.buffer_ids = []
+        self.released = False
+        self.write_allowed = threading.Event()
+        self.write_allowed.set()
+        self.error = error
+
+    def write(self, frame: npt.NDArray[np.uint8]) -> None:
+        """
+        Record a copy of the frame, blocking while writing is not allowed.
+
+        :param frame: The frame.
+        :raises Exception: The configured error.
+        """
+        self.write_allowed.wait()
+        if self.error is not None:
+            raise self.error
+        self.frames.append(frame.copy())
+        self.buffer_ids.append(id(frame))
+
+    def release(self) -> None:
+        """Mark the writer as released."""
+        self.released = True
+
+
+def _write_frame(writer: AsyncVideoWriter, value: int) -> int:
+    """
+    Fill the next buffer of the writer with a value and queue it.
+
+    :param writer: The writer.
+    :param value: The value to fill the frame with.
+    :returns: The id of the buffer that was used.
+    """
+    frame = writer.next_frame()
+    frame.fill(value)
+    writer.write(frame)
+    return id(frame)
+
+
+def test_async_video_writer_keeps_frame_order() -> None:
+    """Test that frames are encoded in the order they were written."""
+    video = _FakeVideoWriter()
+    writer = AsyncVideoWriter(video, _FRAME_SHAPE, max_pending=2)  # type: ignore[arg-type]
+
+    for value in range(20):
+        _write_frame(writer, value)
+    writer.release()
+
+    assert video.released
+    assert [int(frame[0, 0, 0]) for frame in video.frames] == list(range(20))
+    assert all(frame.shape == _FRAME_SHAPE for frame in video.frames)
+
+
+def test_async_video_writer_recycles_buffers() -> None:
+    """Test that an exhausted buffer pool blocks until the encoder hands a buffer back."""
+    video = _FakeVideoWriter()
+    video.write_allowed.clear()
+    writer = AsyncVideoWriter(video, _FRAME_SHAPE, max_pending=1)  # type: ignore[arg-type]
+
+    # max_pending=1 gives two buffers: one being encoded and one pending.
+    pool = {_write_frame(writer, 0), _write_frame(writer, 1)}
+    assert len(pool) == 2
+
+    recycled: list[int] = []
+    waiter = threading.Thread(target=lambda: recycled.append(_write_frame(writer, 2)))
+    waiter.start()
+    waiter.join(timeout=0.2)
+    assert waiter.is_alive(), "next_frame should block while all buffers are in use"
+
+    video.write_allowed.set()
+    waiter.join(timeout=5.0)
+    assert not waiter.is_alive()
+    assert recycled[0] in pool
+
+    writer.release()
+    assert [int(frame[0, 0, 0]) for frame in video.frames] == [0, 1, 2]
+    assert set(video.buffer_ids) == pool
+
+
+def test_async_video_writer_reraises_encoding_errors() -> None:
+    """Test that an error raised while encoding comes back out of `release`."""
+    error = ValueError("encoding failed")
+    video = _FakeVideoWriter(error=error)
+    writer = AsyncVideoWriter(video, _FRAME_SHAPE, max_pending=1)  # type: ignore[arg-type]
+
+    # Buffers keep being recycled after the error, so writing more frames than the pool holds does not block.
+    for value in range(10):
+        _write_frame(writer, value)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        writer.release()
+    assert exc_info.value.__cause__ is error
+    assert video.released
@@ -0,0 +1,119 @@
+import math
+from collections import defaultdict
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+
+from revolve2.modular_robot import ModularRobot
+from revolve2.modular_robot.brain.cpg import BrainCpgNetworkNeighborRandom
+from revolve2.modular_robot_simulation import ModularRobotScene
+from revolve2.simulation.simulator._simulator import Callback
+from revolve2.simulators.mujoco_simulator._simulate_scene import (
+    _last_step,
+    _next_period_step,
+    simulate_scene,
+)
+from revolve2.simulators.mujoco_simulator.viewers import ViewerType
+from revolve2.standards import terrains
+from revolve2.standards.modular_robots_v2 import gecko_v2
+
+
+def _event_steps(period: float, timestep: float, num_events: int) -> list[int]:
+    """
+    Follow the schedule of a periodic event from the first step.
+
+    :param period: The duration of a period. In seconds.
+    :param timestep: The duration of a simulation step. In seconds.
+    :param num_events: The number of events to follow.
+    :returns: The steps at which the events are due.
+    """
+    steps = [0]
+    for _ in range(num_events):
+        steps.append(_next_period_step(steps[-1], period, timestep))
+    return steps[1:]
+
+
+def test_next_period_step_integer_ratio() -> None:
+    """Test that events fall on exact multiples of the period, despite rounding in the divisions."""
+    assert _event_steps(0.1, 0.01, 4) == [10, 20, 30, 40]
+    # 0.2 / 0.001 evaluates to 200.00000000000003.
+    assert _event_steps(0.2, 0.001, 3) == [200, 400, 600]
+    # From within a period, the next event is at the start of the following one.
+    assert _next_period_step(15, 0.1, 0.01) == 20
+
+
+@pytest.mark.parametrize(
+    "period, timestep",
+    [(0.25, 0.1), (1 / 60, 0.001), (0.1, 0.03), (0.5, 0.006)],
+)
+def test_next_period_step_non_integer_ratio(period: float, timestep: float) -> None:
+    """
+    Test that every event is due on the first step at or after its period boundary.
+
+    :param period: The duration of a period. In seconds.
+    :param timestep: The duration of a simulation step. In seconds.
+    """
+    steps = _event_steps(period, timestep, 200)
+
+    for k, step in enumerate(steps, start=1):
+        assert step == math.ceil(k * period / timestep - 1e-9)
+    # No period is skipped or repeated.
+    assert len(set(steps)) == len(steps)
+
+
+def test_next_period_step_period_shorter_than_timestep() -> None:
+    """Test that events shorter than a step are due every step, without catching up on skipped periods."""
+    assert _event_steps(0.004, 0.01, 5) == [1, 2, 3, 4, 5]
+
+
+def test_next_period_step_end_of_run() -> None:
+    """Test the schedule around the last step of a run."""
+    last_step = _last_step(10, 0.01)
+    assert last_step == 1000
+    # 0.3 / 0.1 evaluates to 2.9999999999999996.
+    assert _last_step(0.3, 0.1) == 3
+
+    # A period ending with the run is due on the last step, the next one lies beyond it.
+    assert _next_period_step(last_step - 1, 0.5, 0.01) == last_step
+    assert _next_period_step(last_step, 0.5, 0.01) > last_step
+
+
+def test_simulate_scene_end_of_run_samples() -> None:
+    """Test that the final sample is not preceded by a sample on the last step."""
+    body = gecko_v2()
+    robot = ModularRobot(
+        body=body,
+        brain=BrainCpgNetworkNeighborRandom(body=body, rng=np.random.default_rng(0)),
+    )
+    modular_robot_scene = ModularRobotScene(terrain=terrains.flat())
+    modular_robot_scene.add_robot(robot)
+    scene, _ = modular_robot_scene.to_simulation_scene()
+
+    control_times: list[float] = []
+    callbacks: defaultdict[Callback, list[Callable[..., Any]]] = defaultdict(list)
+    callbacks[Callback.PRE_CONTROL].append(
+        lambda model, data: control_times.append(data.time)
+    )
+
+    states = simulate_scene(
+        scene_id=0,
+        scene=scene,
+        callbacks=callbacks,
+        headless=True,
+        record_settings=None,
+        start_paused=False,
+        control_step=0.1,
+        sample_step=0.5,
+        simulation_time=10,
+        simulation_timestep=0.01,
+        cast_shadows=False,
+        fast_sim=False,
+        viewer_type=ViewerType.CUSTOM,
+    )
+
+    # The initial sample, one every 0.5s up to 9.5s, and the final sample.
+    assert len(states) == 1 + 19 + 1
+    # Control happens at the start and on every period boundary up to and including the last step.
+    assert len(control_times) == 101
+    np.testing.assert_allclose(control_times, np.arange(101) * 0.1, atol=1e-9)